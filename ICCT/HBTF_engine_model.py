@@ -1,15 +1,337 @@
 # HBTF_engine_model.py
 
-import sys
-import numpy as np
 import openmdao.api as om
-from prompt_toolkit.key_binding.bindings.named_commands import self_insert
-from soupsieve.util import lower
 
 import pycycle.api as pyc
 from balance_setup import NPSSIndependent, NPSSDependent, addPair
-import re
-import warnings
+import functools
+
+# Thermo data set and matching fuel type for each thermo method, shared by every HBTF point
+_THERMO = {
+    'CEA': (pyc.species_data.janaf, 'Jet-A(g)'),
+    'TABULAR': (pyc.AIR_JETA_TAB_SPEC, 'FAR'),
+}
+
+# (name, value, units) tables applied in HBTFEngineModel.setup
+_INPUT_DEFAULTS = (
+    ('DESIGN.inlet.MN', 0.751, None),
+    ('DESIGN.fan.MN', 0.4578, None),
+    ('DESIGN.splitter.BPR', 5.105, None),
+    ('DESIGN.splitter.MN1', 0.3104, None),
+    ('DESIGN.splitter.MN2', 0.4518, None),
+    ('DESIGN.duct4.MN', 0.3121, None),
+    ('DESIGN.lpc.MN', 0.3059, None),
+    ('DESIGN.duct6.MN', 0.3563, None),
+    ('DESIGN.hpc.MN', 0.2442, None),
+    ('DESIGN.bld3.MN', 0.3000, None),
+    ('DESIGN.burner.MN', 0.1025, None),
+    ('DESIGN.hpt.MN', 0.3650, None),
+    ('DESIGN.duct11.MN', 0.3063, None),
+    ('DESIGN.lpt.MN', 0.4127, None),
+    ('DESIGN.duct13.MN', 0.4463, None),
+    ('DESIGN.byp_bld.MN', 0.4489, None),
+    ('DESIGN.duct15.MN', 0.4589, None),
+    ('DESIGN.LP_Nmech', 4666.1, 'rpm'),
+    ('DESIGN.HP_Nmech', 14705.7, 'rpm'),
+)
+
+_CYCLE_PARAMS = (
+    ('inlet.ram_recovery', 0.9990, None),
+    ('duct4.dPqP', 0.0048, None),
+    ('duct6.dPqP', 0.0101, None),
+    ('burner.dPqP', 0.0540, None),
+    ('duct11.dPqP', 0.0051, None),
+    ('duct13.dPqP', 0.0107, None),
+    ('duct15.dPqP', 0.0149, None),
+    ('core_nozz.Cv', 0.9933, None),
+    ('byp_bld.bypBld:frac_W', 0.005, None),
+    ('byp_nozz.Cv', 0.9939, None),
+    ('hpc.cool1:frac_W', 0.050708, None),
+    ('hpc.cool1:frac_P', 0.5, None),
+    ('hpc.cool1:frac_work', 0.5, None),
+    ('hpc.cool2:frac_W', 0.020274, None),
+    ('hpc.cool2:frac_P', 0.55, None),
+    ('hpc.cool2:frac_work', 0.5, None),
+    ('bld3.cool3:frac_W', 0.067214, None),
+    ('bld3.cool4:frac_W', 0.101256, None),
+    ('hpc.cust:frac_P', 0.5, None),
+    ('hpc.cust:frac_work', 0.5, None),
+    ('hpc.cust:frac_W', 0.0445, None),
+    ('hpt.cool3:frac_P', 1.0, None),
+    ('hpt.cool4:frac_P', 0.0, None),
+    ('lpt.cool1:frac_P', 1.0, None),
+    ('lpt.cool2:frac_P', 0.0, None),
+    ('hp_shaft.HPX', 250.0, 'hp'),
+)
+
+
+# Flow station connections: (source element, source port, target element) -> target.Fl_I
+_FLOW_EDGES = (
+    ('fc', 'Fl_O', 'inlet'),
+    ('inlet', 'Fl_O', 'fan'),
+    ('fan', 'Fl_O', 'splitter'),
+    ('splitter', 'Fl_O1', 'duct4'),
+    ('duct4', 'Fl_O', 'lpc'),
+    ('lpc', 'Fl_O', 'duct6'),
+    ('duct6', 'Fl_O', 'hpc'),
+    ('hpc', 'Fl_O', 'bld3'),
+    ('bld3', 'Fl_O', 'burner'),
+    ('burner', 'Fl_O', 'hpt'),
+    ('hpt', 'Fl_O', 'duct11'),
+    ('duct11', 'Fl_O', 'lpt'),
+    ('lpt', 'Fl_O', 'duct13'),
+    ('duct13', 'Fl_O', 'core_nozz'),
+    ('splitter', 'Fl_O2', 'byp_bld'),
+    ('byp_bld', 'Fl_O', 'duct15'),
+    ('duct15', 'Fl_O', 'byp_nozz'),
+)
+
+# Bleed connections, made without the static flow properties
+_BLEED_EDGES = (
+    ('hpc.cool1', 'lpt.cool1'),
+    ('hpc.cool2', 'lpt.cool2'),
+    ('bld3.cool3', 'hpt.cool3'),
+    ('bld3.cool4', 'hpt.cool4'),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _design_balance_pairs():
+    """
+    Balance specs for the DESIGN point: W, FAR and the two turbine PRs.
+    """
+    pairs = []
+
+    # Define Dependent and Independent variables using original names
+    Dependent_Fn_DES = NPSSDependent(
+        name='Fn_DES',
+        eq_lhs='perf.Fn',
+        eq_rhs='Fn_DES',
+        eq_units='lbf'
+    )
+    Independent_W = NPSSIndependent(
+        name='W',
+        varName='fc.W',
+        units='lbm/s')
+
+    pairs.append((Dependent_Fn_DES, Independent_W))
+
+    # Define Dependent and Independent variables using original names
+    Dependent_T4_MAX = NPSSDependent(
+        name='T4_MAX',
+        eq_lhs='burner.Fl_O:tot:T',
+        eq_rhs='T4_MAX',
+        eq_units='degR'
+    )
+    Independent_FAR = NPSSIndependent(
+        name='FAR',
+        varName='burner.Fl_I:FAR',
+        units=None)
+
+    pairs.append((Dependent_T4_MAX, Independent_FAR))
+
+    Dependent_lp_pwr_diff_new = NPSSDependent(
+        name='lp_pwr_diff',
+        eq_lhs='lp_shaft.pwr_in_real + lp_shaft.pwr_out_real',
+        eq_rhs='lp_power_diff',
+        eq_units='hp'
+    )
+    Independent_lpt_PR = NPSSIndependent(
+        name='lpt_PR',
+        varName='lpt.PR',
+        units=None,
+        val=1.5,
+        lower=1.001,
+        upper=16,
+        )
+
+    pairs.append((Dependent_lp_pwr_diff_new, Independent_lpt_PR))
+
+    Dependent_hp_pwr_diff_new = NPSSDependent(
+        name='hp_pwr_diff',
+        eq_lhs='hp_shaft.pwr_in_real + hp_shaft.pwr_out_real',
+        eq_rhs='hp_power_diff',
+        eq_units='hp'
+    )
+    Independent_hpt_PR = NPSSIndependent(
+        name='hpt_PR',
+        varName='hpt.PR',
+        units=None,
+        val=1.5,
+        lower=1.001,
+        upper=8,
+    )
+
+    pairs.append((Dependent_hp_pwr_diff_new, Independent_hpt_PR))
+
+    return tuple(pairs)
+
+
+@functools.lru_cache(maxsize=None)
+def _offdes_shared_balance_pairs():
+    """
+    Balance specs shared by every off-design point: W, BPR and the two spool speeds.
+    """
+    pairs = []
+
+    # In OFF-DESIGN mode we need to redefine the balances:
+    #   State Variables:
+    #           (W)        Inlet mass flow rate to balance core flow area
+    #                      LHS: core_nozz.Throat:stat:area == Area from DESIGN calculation
+    #
+    #           (FAR)      Fuel-air ratio to balance Thrust req.
+    #                      LHS: perf.Fn  == RHS: Thrust requirement (set when TF is instantiated)
+    #
+    #           (BPR)      Bypass ratio to balance byp. noz. area
+    #                      LHS: byp_nozz.Throat:stat:area == Area from DESIGN calculation
+    #
+    #           (lp_Nmech)   LP spool speed to balance shaft power on the low spool
+    #           (hp_Nmech)   HP spool speed to balance shaft power on the high spool
+
+    Independent_W = NPSSIndependent(
+        name='W',
+        varName='fc.W',
+        units='lbm/s',
+        val=100.,
+        lower=10.,
+        upper=1000.,
+    )
+
+    Dependent_core_nozz_Throat_stat_area = NPSSDependent(
+        name='core_nozz_Throat_stat_area',
+        eq_lhs='core_nozz.Throat:stat:area',
+        eq_rhs='rhs_zero_core_nozz_Throat_stat_area',
+        eq_units='inch**2',
+    )
+
+    pairs.append((Dependent_core_nozz_Throat_stat_area, Independent_W))
+
+    Independent_BPR = NPSSIndependent(
+        name='BPR',
+        varName='splitter.BPR',
+        units=None,
+        val=2.0,
+        lower=1.0,
+        upper=10.0,
+    )
+
+    Dependent_byp_nozz_Throat_stat_area = NPSSDependent(
+        name='byp_nozz_Throat_stat_area',
+        eq_lhs='byp_nozz.Throat:stat:area',
+        eq_rhs='rhs_zero_byp_nozz_Throat_stat_area',
+        eq_units='inch**2',
+    )
+
+    pairs.append((Dependent_byp_nozz_Throat_stat_area, Independent_BPR))
+
+    Independent_lp_Nmech = NPSSIndependent(
+        name='lp_Nmech',
+        varName='LP_Nmech',
+        units='rpm',
+        val=1.5,
+        lower=500.,
+    )
+
+    Dependent_lp_shaft_pwr_net = NPSSDependent(
+        name='lp_shaft_pwr_in_real',
+        eq_lhs='lp_shaft.pwr_in_real + lp_shaft.pwr_out_real',
+        eq_rhs='lp_power_diff',
+        eq_units='hp',
+    )
+
+    pairs.append((Dependent_lp_shaft_pwr_net, Independent_lp_Nmech))
+
+    Independent_hp_Nmech = NPSSIndependent(
+        name='hp_Nmech',
+        varName='HP_Nmech',
+        units='rpm',
+        val=1.5,
+        lower=500.,
+    )
+
+    Dependent_hp_shaft_pwr_net = NPSSDependent(
+        name='hp_shaft_pwr_in_real',
+        eq_lhs='hp_shaft.pwr_in_real + hp_shaft.pwr_out_real',
+        eq_rhs='hp_power_diff',
+        eq_units='hp',
+    )
+
+    pairs.append((Dependent_hp_shaft_pwr_net, Independent_hp_Nmech))
+
+    return tuple(pairs)
+
+
+@functools.lru_cache(maxsize=None)
+def _offdes_T4_balance_pairs():
+    """
+    Off-design balance specs when throttling on T4: FAR is varied to hit T4_MAX.
+    """
+    pairs = []
+
+    Independent_FAR = NPSSIndependent(
+        name='FAR',
+        varName='burner.Fl_I:FAR',
+        units=None,
+        val=0.017,
+        lower=1e-4,
+        upper=1.0,
+    )
+
+    Dependent_T4_MAX_OFFDES = NPSSDependent(
+        name='T4_MAX_OFFDES',
+        eq_lhs='burner.Fl_O:tot:T',
+        eq_rhs='T4_MAX',
+        eq_units='degR',
+    )
+
+    pairs.append((Dependent_T4_MAX_OFFDES, Independent_FAR))
+
+    return tuple(pairs) + _offdes_shared_balance_pairs()
+
+
+@functools.lru_cache(maxsize=None)
+def _offdes_pt_balance_pairs():
+    """
+    Off-design balance specs when throttling on thrust: FAR is varied to hit Fn_Target.
+    """
+    pairs = []
+
+    Independent_FAR_OFFDES = NPSSIndependent(
+        name='FAR',
+        varName='burner.Fl_I:FAR',
+        units=None,
+        val=0.017,
+        lower=1e-4,
+        upper=1.0,
+    )
+
+    Dependent_Fn_OFFDES = NPSSDependent(
+        name='Fn_OFFDES',
+        eq_lhs='perf.Fn',
+        eq_rhs='Fn_Target',
+        eq_units='lbf',
+    )
+
+    pairs.append((Dependent_Fn_OFFDES, Independent_FAR_OFFDES))
+
+    return tuple(pairs) + _offdes_shared_balance_pairs()
+
+
+# Off-design points: (name, throttle_mode, MN, alt [ft], dTs [degR])
+_OD_POINTS = (
+    ('OD_full_pwr', 'T4', 0.8, 35000.0, 0.0),
+    ('OD_part_pwr', 'percent_thrust', 0.8, 35000.0, 0.0),
+)
+
+# Balance spec builder for each point configuration, keyed by 'design' or the off-design throttle_mode.
+# The specs are only read by `addPair`, so each set is built once and shared by every HBTF instance
+# and every re-setup.
+_BALANCE_PAIR_BUILDERS = {
+    'design': _design_balance_pairs,
+    'T4': _offdes_T4_balance_pairs,
+    'percent_thrust': _offdes_pt_balance_pairs,
+}
+
 
 class HBTFEngineModel(pyc.MPCycle):
     """
@@ -18,6 +340,9 @@ class HBTFEngineModel(pyc.MPCycle):
 
     def initialize(self):
         self.options.declare('thermo_method', default='CEA')
+        self.options.declare('parallel_od', default=False,
+                             desc='If True, the off-design points are placed in a ParallelGroup so they can be '
+                                  'solved concurrently under MPI (e.g. `mpiexec -n 2 python run.py`).')
         super().initialize()
 
     def setup(self):
@@ -28,80 +353,32 @@ class HBTFEngineModel(pyc.MPCycle):
 
         ##### THESE VALUES DON'T MEAN ANYTHING - ACTUAL DEFAULT VALUES ARE IN set_model_inputs.py
         ##### These are just to have the model started
-        self.set_input_defaults('DESIGN.inlet.MN', 0.751)
-        self.set_input_defaults('DESIGN.fan.MN', 0.4578)
-        self.set_input_defaults('DESIGN.splitter.BPR', 5.105)
-        self.set_input_defaults('DESIGN.splitter.MN1', 0.3104)
-        self.set_input_defaults('DESIGN.splitter.MN2', 0.4518)
-        self.set_input_defaults('DESIGN.duct4.MN', 0.3121)
-        self.set_input_defaults('DESIGN.lpc.MN', 0.3059)
-        self.set_input_defaults('DESIGN.duct6.MN', 0.3563)
-        self.set_input_defaults('DESIGN.hpc.MN', 0.2442)
-        self.set_input_defaults('DESIGN.bld3.MN', 0.3000)
-        self.set_input_defaults('DESIGN.burner.MN', 0.1025)
-        self.set_input_defaults('DESIGN.hpt.MN', 0.3650)
-        self.set_input_defaults('DESIGN.duct11.MN', 0.3063)
-        self.set_input_defaults('DESIGN.lpt.MN', 0.4127)
-        self.set_input_defaults('DESIGN.duct13.MN', 0.4463)
-        self.set_input_defaults('DESIGN.byp_bld.MN', 0.4489)
-        self.set_input_defaults('DESIGN.duct15.MN', 0.4589)
-        self.set_input_defaults('DESIGN.LP_Nmech', 4666.1, units='rpm')
-        self.set_input_defaults('DESIGN.HP_Nmech', 14705.7, units='rpm')
-
-
-
+        for name, val, units in _INPUT_DEFAULTS:
+            self.set_input_defaults(name, val, units=units)
 
         # --- Set up bleed values -----
 
         ##### THESE VALUES DON'T MEAN ANYTHING - ACTUAL DEFAULT VALUES ARE IN set_model_inputs.py
         ##### These are just to have the model started
-        self.pyc_add_cycle_param('inlet.ram_recovery', 0.9990)
-        self.pyc_add_cycle_param('duct4.dPqP', 0.0048)
-        self.pyc_add_cycle_param('duct6.dPqP', 0.0101)
-        self.pyc_add_cycle_param('burner.dPqP', 0.0540)
-        self.pyc_add_cycle_param('duct11.dPqP', 0.0051)
-        self.pyc_add_cycle_param('duct13.dPqP', 0.0107)
-        self.pyc_add_cycle_param('duct15.dPqP', 0.0149)
-        self.pyc_add_cycle_param('core_nozz.Cv', 0.9933)
-        self.pyc_add_cycle_param('byp_bld.bypBld:frac_W', 0.005)
-        self.pyc_add_cycle_param('byp_nozz.Cv', 0.9939)
-        self.pyc_add_cycle_param('hpc.cool1:frac_W', 0.050708)
-        self.pyc_add_cycle_param('hpc.cool1:frac_P', 0.5)
-        self.pyc_add_cycle_param('hpc.cool1:frac_work', 0.5)
-        self.pyc_add_cycle_param('hpc.cool2:frac_W', 0.020274)
-        self.pyc_add_cycle_param('hpc.cool2:frac_P', 0.55)
-        self.pyc_add_cycle_param('hpc.cool2:frac_work', 0.5)
-        self.pyc_add_cycle_param('bld3.cool3:frac_W', 0.067214)
-        self.pyc_add_cycle_param('bld3.cool4:frac_W', 0.101256)
-        self.pyc_add_cycle_param('hpc.cust:frac_P', 0.5)
-        self.pyc_add_cycle_param('hpc.cust:frac_work', 0.5)
-        self.pyc_add_cycle_param('hpc.cust:frac_W', 0.0445)
-        self.pyc_add_cycle_param('hpt.cool3:frac_P', 1.0)
-        self.pyc_add_cycle_param('hpt.cool4:frac_P', 0.0)
-        self.pyc_add_cycle_param('lpt.cool1:frac_P', 1.0)
-        self.pyc_add_cycle_param('lpt.cool2:frac_P', 0.0)
-        self.pyc_add_cycle_param('hp_shaft.HPX', 250.0, units='hp')
-
+        for name, val, units in _CYCLE_PARAMS:
+            self.pyc_add_cycle_param(name, val, units=units)
 
         # Add off-design points
-        self.od_pts = ['OD_full_pwr', 'OD_part_pwr']
-
-        self.od_MNs = [0.8, 0.8]
-        self.od_alts = [35000.0, 35000.0]
-        #self.od_Fn_target = [5500.0, 5300]
-        self.od_dTs = [0.0, 0.0]
+        self.od_pts = [pt[0] for pt in _OD_POINTS]
 
-        self.pyc_add_pnt('OD_full_pwr', HBTF(design=False, thermo_method='CEA', throttle_mode='T4'))
+        # The OD points only depend on DESIGN, so they can run side by side. The ParallelGroup promotes '*'
+        # so the points keep their 'OD_full_pwr.*' / 'OD_part_pwr.*' names.
+        od_group = None
+        if self.options['parallel_od']:
+            od_group = self.add_subsystem('od_points', om.ParallelGroup(), promotes=['*'])
 
-        self.set_input_defaults('OD_full_pwr.fc.MN', 0.8)
-        self.set_input_defaults('OD_full_pwr.fc.alt', 35000.0, units='ft')
-        self.set_input_defaults('OD_full_pwr.fc.dTs', 0., units='degR')
+        for pt, throttle_mode, MN, alt, dTs in _OD_POINTS:
+            self.pyc_add_pnt(pt, HBTF(design=False, thermo_method='CEA', throttle_mode=throttle_mode),
+                             group=od_group)
 
-        self.pyc_add_pnt('OD_part_pwr', HBTF(design=False, thermo_method='CEA', throttle_mode='percent_thrust'))
-
-        self.set_input_defaults('OD_part_pwr.fc.MN', 0.8)
-        self.set_input_defaults('OD_part_pwr.fc.alt', 35000.0, units='ft')
-        self.set_input_defaults('OD_part_pwr.fc.dTs', 0., units='degR')
+            self.set_input_defaults(f'{pt}.fc.MN', MN)
+            self.set_input_defaults(f'{pt}.fc.alt', alt, units='ft')
+            self.set_input_defaults(f'{pt}.fc.dTs', dTs, units='degR')
 
         #self.connect('OD_full_pwr.perf.Fn', 'Fn_max')
 
@@ -113,11 +390,14 @@ class HBTFEngineModel(pyc.MPCycle):
 
         super().setup()
 
+
 class HBTF(pyc.Cycle):
     def initialize(self):
         self.options.declare('design', default=True)
         self.options.declare('thermo_method', default='CEA')
         self.options.declare('throttle_mode', default='T4', values=['T4', 'percent_thrust'])
+        self.options.declare('nonlinear_solver', default='newton', values=['newton', 'broyden'],
+                             desc='Cycle-level nonlinear solver. "broyden" reuses the jacobian between iterations.')
 
         super().initialize()
 
@@ -126,14 +406,11 @@ class HBTF(pyc.Cycle):
         thermo_method = self.options['thermo_method']
         throttle_mode = self.options['throttle_mode']
 
-        if thermo_method == 'TABULAR':
-            self.options['thermo_method'] = 'TABULAR'
-            self.options['thermo_data'] = pyc.AIR_JETA_TAB_SPEC
-            FUEL_TYPE = 'FAR'
-        else:
-            self.options['thermo_method'] = 'CEA'
-            self.options['thermo_data'] = pyc.species_data.janaf
-            FUEL_TYPE = 'Jet-A(g)'
+        if thermo_method != 'TABULAR':
+            thermo_method = 'CEA'
+        thermo_data, FUEL_TYPE = _THERMO[thermo_method]
+        self.options['thermo_method'] = thermo_method
+        self.options['thermo_data'] = thermo_data
 
         # Add components (same as in your provided code)
         # [Add all components and connections here as per your code]
@@ -201,250 +478,55 @@ class HBTF(pyc.Cycle):
 
         balance = self.add_subsystem('balance', om.BalanceComp())
 
-        from openmdao.core.explicitcomponent import ExplicitComponent
-
-
-        if design:
-
-            # Define Dependent and Independent variables using original names
-            Dependent_Fn_DES = NPSSDependent(
-                name='Fn_DES',
-                eq_lhs='perf.Fn',
-                eq_rhs='Fn_DES',
-                eq_units='lbf'
-            )
-            Independent_W = NPSSIndependent(
-                name='W',
-                varName='fc.W',
-                units='lbm/s')
-
-            addPair(self,balance,Dependent_Fn_DES, Independent_W)
-
-            # Define Dependent and Independent variables using original names
-            Dependent_T4_MAX = NPSSDependent(
-                name='T4_MAX',
-                eq_lhs='burner.Fl_O:tot:T',
-                eq_rhs='T4_MAX',
-                eq_units='degR'
-            )
-            Independent_FAR = NPSSIndependent(
-                name='FAR',
-                varName='burner.Fl_I:FAR',
-                units=None)
-
-            addPair(self,balance,Dependent_T4_MAX, Independent_FAR)
-
-            Dependent_lp_pwr_diff_new = NPSSDependent(
-                name='lp_pwr_diff',
-                eq_lhs='lp_shaft.pwr_in_real + lp_shaft.pwr_out_real',
-                eq_rhs='lp_power_diff',
-                eq_units='hp'
-            )
-            Independent_lpt_PR = NPSSIndependent(
-                name='lpt_PR',
-                varName='lpt.PR',
-                units=None,
-                val=1.5,
-                lower=1.001,
-                upper=16,
-                )
-
-            addPair(self,balance,Dependent_lp_pwr_diff_new, Independent_lpt_PR)
-
-            Dependent_hp_pwr_diff_new = NPSSDependent(
-                name='hp_pwr_diff',
-                eq_lhs='hp_shaft.pwr_in_real + hp_shaft.pwr_out_real',
-                eq_rhs='hp_power_diff',
-                eq_units='hp'
-            )
-            Independent_hpt_PR = NPSSIndependent(
-                name='hpt_PR',
-                varName='hpt.PR',
-                units=None,
-                val=1.5,
-                lower=1.001,
-                upper=8,
-            )
-
-            addPair(self,balance,Dependent_hp_pwr_diff_new, Independent_hpt_PR)
-        else:
-
-            # In OFF-DESIGN mode we need to redefine the balances:
-            #   State Variables:
-            #           (W)        Inlet mass flow rate to balance core flow area
-            #                      LHS: core_nozz.Throat:stat:area == Area from DESIGN calculation
-            #
-            #           (FAR)      Fuel-air ratio to balance Thrust req.
-            #                      LHS: perf.Fn  == RHS: Thrust requirement (set when TF is instantiated)
-            #
-            #           (BPR)      Bypass ratio to balance byp. noz. area
-            #                      LHS: byp_nozz.Throat:stat:area == Area from DESIGN calculation
-            #
-            #           (lp_Nmech)   LP spool speed to balance shaft power on the low spool
-            #           (hp_Nmech)   HP spool speed to balance shaft power on the high spool
-
-            if self.options['throttle_mode'] == 'T4':
-
-                Independent_FAR = NPSSIndependent(
-                    name='FAR',
-                    varName='burner.Fl_I:FAR',
-                    units=None,
-                    val=0.017,
-                    lower=1e-4,
-                    upper=1.0,
-                )
-
-                Dependent_T4_MAX_OFFDES = NPSSDependent(
-                    name='T4_MAX_OFFDES',
-                    eq_lhs='burner.Fl_O:tot:T',
-                    eq_rhs='T4_MAX',
-                    eq_units='degR',
-                )
-
-                addPair(self,balance,Dependent_T4_MAX_OFFDES, Independent_FAR)
-
-
-            elif self.options['throttle_mode'] == 'percent_thrust':
-
-                Independent_FAR_OFFDES = NPSSIndependent(
-                    name='FAR',
-                    varName='burner.Fl_I:FAR',
-                    units=None,
-                    val=0.017,
-                    lower=1e-4,
-                    upper=1.0,
-                )
-
-                Dependent_Fn_OFFDES = NPSSDependent(
-                    name='Fn_OFFDES',
-                    eq_lhs='perf.Fn',
-                    eq_rhs='Fn_Target',
-                    eq_units='lbf',
-                )
-
-                addPair(self,balance,Dependent_Fn_OFFDES, Independent_FAR_OFFDES)
-
-            Independent_W = NPSSIndependent(
-                name='W',
-                varName='fc.W',
-                units='lbm/s',
-                val=100.,
-                lower=10.,
-                upper=1000.,
-            )
-
-            Dependent_core_nozz_Throat_stat_area = NPSSDependent(
-                name='core_nozz_Throat_stat_area',
-                eq_lhs='core_nozz.Throat:stat:area',
-                eq_rhs='rhs_zero_core_nozz_Throat_stat_area',
-                eq_units='inch**2',
-            )
-
-            addPair(self,balance,Dependent_core_nozz_Throat_stat_area, Independent_W)
-
-            Independent_BPR = NPSSIndependent(
-                name='BPR',
-                varName='splitter.BPR',
-                units=None,
-                val=2.0,
-                lower=1.0,
-                upper=10.0,
-            )
-
-            Dependent_byp_nozz_Throat_stat_area = NPSSDependent(
-                name='byp_nozz_Throat_stat_area',
-                eq_lhs='byp_nozz.Throat:stat:area',
-                eq_rhs='rhs_zero_byp_nozz_Throat_stat_area',
-                eq_units='inch**2',
-            )
-
-            addPair(self,balance,Dependent_byp_nozz_Throat_stat_area, Independent_BPR)
-
-            Independent_lp_Nmech = NPSSIndependent(
-                name='lp_Nmech',
-                varName='LP_Nmech',
-                units='rpm',
-                val=1.5,
-                lower=500.,
-            )
-
-            Dependent_lp_shaft_pwr_net = NPSSDependent(
-                name='lp_shaft_pwr_in_real',
-                eq_lhs='lp_shaft.pwr_in_real + lp_shaft.pwr_out_real',
-                eq_rhs='lp_power_diff',
-                eq_units='hp',
-            )
-
-            addPair(self,balance,Dependent_lp_shaft_pwr_net, Independent_lp_Nmech)
-
-            Independent_hp_Nmech = NPSSIndependent(
-                name='hp_Nmech',
-                varName='HP_Nmech',
-                units='rpm',
-                val=1.5,
-                lower=500.,
-            )
-
-            Dependent_hp_shaft_pwr_net = NPSSDependent(
-                name='hp_shaft_pwr_in_real',
-                eq_lhs='hp_shaft.pwr_in_real + hp_shaft.pwr_out_real',
-                eq_rhs='hp_power_diff',
-                eq_units='hp',
-            )
-
-            addPair(self,balance,Dependent_hp_shaft_pwr_net, Independent_hp_Nmech)
-
+        # Balance specs are cached per point configuration; only the OpenMDAO components are rebuilt.
+        # Each balance stays a separate scalar state rather than one packed vector: they use different
+        # eq_units (lbf, degR, hp, inch**2) and bounds, and the per-state names (balance.W, balance.FAR, ...)
+        # are used by the DES->OD connections and the run scripts.
+        balance_pairs = _BALANCE_PAIR_BUILDERS['design' if design else throttle_mode]()
+        for Dependent_obj, Independent_obj in balance_pairs:
+            addPair(self, balance, Dependent_obj, Independent_obj)
 
         # Set up all the flow connections:
-        self.pyc_connect_flow('fc.Fl_O', 'inlet.Fl_I')
-        self.pyc_connect_flow('inlet.Fl_O', 'fan.Fl_I')
-        self.pyc_connect_flow('fan.Fl_O', 'splitter.Fl_I')
-        self.pyc_connect_flow('splitter.Fl_O1', 'duct4.Fl_I')
-        self.pyc_connect_flow('duct4.Fl_O', 'lpc.Fl_I')
-        self.pyc_connect_flow('lpc.Fl_O', 'duct6.Fl_I')
-        self.pyc_connect_flow('duct6.Fl_O', 'hpc.Fl_I')
-        self.pyc_connect_flow('hpc.Fl_O', 'bld3.Fl_I')
-        self.pyc_connect_flow('bld3.Fl_O', 'burner.Fl_I')
-        self.pyc_connect_flow('burner.Fl_O', 'hpt.Fl_I')
-        self.pyc_connect_flow('hpt.Fl_O', 'duct11.Fl_I')
-        self.pyc_connect_flow('duct11.Fl_O', 'lpt.Fl_I')
-        self.pyc_connect_flow('lpt.Fl_O', 'duct13.Fl_I')
-        self.pyc_connect_flow('duct13.Fl_O', 'core_nozz.Fl_I')
-        self.pyc_connect_flow('splitter.Fl_O2', 'byp_bld.Fl_I')
-        self.pyc_connect_flow('byp_bld.Fl_O', 'duct15.Fl_I')
-        self.pyc_connect_flow('duct15.Fl_O', 'byp_nozz.Fl_I')
+        for src, port, target in _FLOW_EDGES:
+            self.pyc_connect_flow(f'{src}.{port}', f'{target}.Fl_I')
 
         # Bleed flows:
-        self.pyc_connect_flow('hpc.cool1', 'lpt.cool1', connect_stat=False)
-        self.pyc_connect_flow('hpc.cool2', 'lpt.cool2', connect_stat=False)
-        self.pyc_connect_flow('bld3.cool3', 'hpt.cool3', connect_stat=False)
-        self.pyc_connect_flow('bld3.cool4', 'hpt.cool4', connect_stat=False)
+        for src, target in _BLEED_EDGES:
+            self.pyc_connect_flow(src, target, connect_stat=False)
 
         #Specify solver settings:
-        newton = self.nonlinear_solver = om.NewtonSolver()
+        if self.options['nonlinear_solver'] == 'broyden':
+            # Quasi-Newton over the full cycle state: the jacobian is computed once with the DirectSolver
+            # and then reused through rank-1 Broyden updates. It is only recomputed when the update
+            # diverges or stops converging (the default 'diverge_limit' / 'max_converge_failures'),
+            # which falls back to a plain Newton step.
+            # Note: the balances cannot be listed in 'state_vars' alone because the map balances
+            # inside the compressors/turbines have no solver of their own.
+            newton = self.nonlinear_solver = om.BroydenSolver()
+        else:
+            newton = self.nonlinear_solver = om.NewtonSolver()
+            newton.options['solve_subsystems'] = True
+            newton.options['max_sub_solves'] = 1000
+            # newton.options['debug_print'] = True # for Debugging
+
         newton.options['atol'] = 1e-6
 
         # set this very small, so it never activates and we rely on atol
         newton.options['rtol'] = 1e-99
         newton.options['iprint'] = 1
         newton.options['maxiter'] = 50
-        newton.options['solve_subsystems'] = True
-        newton.options['max_sub_solves'] = 1000
-        newton.options['reraise_child_analysiserror'] = False
         newton.options['err_on_non_converge'] = True
 
-        newton.options['debug_print'] = False #True for Debugging
-
-        # ls = newton.linesearch = BoundsEnforceLS()
-        ls = newton.linesearch = om.ArmijoGoldsteinLS()
-        ls.options['stall_limit'] = 50
-        ls.options['err_on_non_converge'] = True
-        ls.options['maxiter'] = 3
-        ls.options['rho'] = 0.75
+        # Only clip the Newton step at the balance bounds; unlike ArmijoGoldsteinLS this never
+        # re-evaluates the whole cycle to backtrack.
+        # ls = newton.linesearch = om.ArmijoGoldsteinLS()
+        ls = newton.linesearch = om.BoundsEnforceLS()
+        ls.options['bound_enforcement'] = 'vector'
         ls.options['print_bound_enforce'] = True
 
-        self.linear_solver = om.DirectSolver()
+        # Assemble the (block-sparse) cycle jacobian so the LU factorization works on the actual sparsity
+        self.options['assembled_jac_type'] = 'csc'
+        self.linear_solver = om.DirectSolver(assemble_jac=True)
+        newton.linear_solver = om.DirectSolver(assemble_jac=True)
 
-        warnings.filterwarnings('ignore', category=om.SolverWarning)
-
-        super().setup()
\ No newline at end of file
+        super().setup()
@@ -3,6 +3,119 @@ import numpy as np
 from openmdao.utils.cs_safe import abs as cs_abs
 from openmdao.utils.general_utils import shape_to_len
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Balances shorter than this are faster through plain numpy than through numexpr
+_NUMEXPR_MIN_SIZE = 64
+
+# Balances shorter than this are faster through plain numpy than through the numba kernel
+_KERNEL_MIN_SIZE = 64
+
+
+def _balance_kernel(lhs, rhs, mult, normalize, out_res, out_dlhs, out_drhs, out_dmult):
+    """
+    Scaled residual of a flattened balance and its partials with respect to lhs, rhs and mult.
+    """
+    for i in prange(rhs.shape[0]):
+        r = rhs[i]
+        if normalize:
+            absr = abs(r)
+            if absr >= 2:
+                s = 1.0 / absr
+                ds = -np.sign(r) / (r * r)
+            else:
+                denom = 0.25 * r * r + 1.0
+                s = 1.0 / denom
+                ds = -0.5 * r / (denom * denom)
+        else:
+            s = 1.0
+            ds = 0.0
+        diff = mult[i] * lhs[i] - r
+        out_res[i] = diff * s
+        out_dlhs[i] = mult[i] * s
+        out_drhs[i] = diff * ds - s
+        out_dmult[i] = lhs[i] * s
+
+
+# numba is optional, balances go through numpy when it is not installed
+if njit is not None:
+    # no fastmath, the kernel has to give the same residuals and partials as the numpy path
+    _balance_kernel = njit(cache=True, parallel=True)(_balance_kernel)
+
+
+def _compute_scale(rhs, normalize, scale, dscale=None):
+    """
+    Compute the residual scale factor and its derivative with respect to the RHS.
+
+    Parameters
+    ----------
+    rhs : float or np.ndarray
+        Value of the right-hand-side of the balance.
+    normalize : bool
+        If False the scale factor is one everywhere.
+    scale : np.ndarray
+        Buffer the scale factor is written to.
+    dscale : np.ndarray or None
+        Buffer the derivative of the scale factor is written to, if given.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        The scale factor and its derivative with respect to rhs.
+    """
+    if not normalize:
+        # the buffers hold their initial ones and zeros
+        return scale, dscale
+
+    # a scalar constant rhs is a Python float, the masks below need an array to invert
+    rhs = np.asarray(rhs)
+    absr = cs_abs(rhs)
+    denom_small = 0.25 * rhs * rhs + 1.0
+    mask_large = absr >= 2
+    mask_small = ~mask_large
+
+    # the where= masks keep the unused lane away from a divide by zero
+    np.divide(1.0, absr, out=scale, where=mask_large)
+    np.divide(1.0, denom_small, out=scale, where=mask_small)
+
+    if dscale is not None:
+        np.divide(-np.sign(rhs), rhs * rhs, out=dscale, where=mask_large)
+        np.divide(-0.5 * rhs, denom_small ** 2, out=dscale, where=mask_small)
+
+    return scale, dscale
+
+
+def _residual_expr(normalize, use_mult):
+    """
+    Build the numexpr expression for the scaled residual of one balance.
+
+    Parameters
+    ----------
+    normalize : bool
+        Specifies whether the residual is normalized by a quadratic function of the RHS.
+    use_mult : bool
+        Specifies whether the LHS multiplier is used.
+
+    Returns
+    -------
+    str
+        Expression of lhs, rhs and mult for numexpr.evaluate.
+    """
+    expr = '(mult * lhs - rhs)' if use_mult else '(lhs - rhs)'
+    if normalize:
+        expr += ' * where(abs(rhs) >= 2, 1.0 / abs(rhs), 1.0 / (0.25 * rhs * rhs + 1))'
+    return expr
+
+
 class NewBalanceComp(ImplicitComponent):
     """
     A simple equation balance for solving implicit equations, modified to allow constants on either side.
@@ -46,6 +159,17 @@ class NewBalanceComp(ImplicitComponent):
     ----------
     _state_vars : dict
         Cache the data provided during `add_balance` so everything can be saved until setup is called.
+    _state_list : list
+        Per-balance tuples of the options read by apply_nonlinear and linearize.
+    _res_expr : dict
+        Fused numexpr residual expression of each balance.
+    _scratch : dict
+        Scale factor buffers of each balance, reused across calls.
+    _kernel_scratch : dict
+        Output buffers of the numba balance kernel for each long balance.
+    _packed_layout : tuple or None
+        Slices of each balance in the packed vectors, the packed normalize mask and the packed
+        lhs, rhs and mult buffers. Built on the first packed evaluation.
     """
 
     def initialize(self):
@@ -56,13 +180,23 @@ class NewBalanceComp(ImplicitComponent):
                              desc='A callable function that can provide an initial guess '
                                   'for the state variable(s) based on the inputs, outputs, '
                                   'and residuals.')
+        self.options.declare('packed', types=bool, default=False,
+                             desc='If True, all balances are evaluated together as one contiguous '
+                                  'vector instead of balance by balance.')
 
     def __init__(self, name=None, eq_units=None, lhs_name=None, rhs_name=None, lhs_val=None,
                  rhs_val=None, use_mult=False, mult_name=None, mult_val=1.0, normalize=True,
                  val=None, **kwargs):
-        super().__init__()
+        # Component options go to the constructor, the remaining kwargs to the first balance
+        options = {opt: kwargs.pop(opt) for opt in ('guess_func', 'packed') if opt in kwargs}
+        super().__init__(**options)
 
         self._state_vars = {}
+        self._state_list = []
+        self._res_expr = {}
+        self._scratch = {}
+        self._kernel_scratch = {}
+        self._packed_layout = None
 
         if name is not None:
             self.add_balance(name, eq_units=eq_units, lhs_name=lhs_name, rhs_name=rhs_name,
@@ -150,16 +284,16 @@ class NewBalanceComp(ImplicitComponent):
                            val=np.ones(shape),
                            units=options['eq_units'])
         else:
-            # Ensure lhs_val is an array of correct shape
-            options['lhs_val'] = np.full(shape, lhs_val)
+            # Scalar constants are left to numpy broadcasting
+            options['lhs_val'] = lhs_val if np.ndim(lhs_val) == 0 else np.asarray(lhs_val)
 
         if rhs_val is None:
             self.add_input(options['rhs_name'],
                            val=np.ones(shape),
                            units=options['eq_units'])
         else:
-            # Ensure rhs_val is an array of correct shape
-            options['rhs_val'] = np.full(shape, rhs_val)
+            # Scalar constants are left to numpy broadcasting
+            options['rhs_val'] = rhs_val if np.ndim(rhs_val) == 0 else np.asarray(rhs_val)
 
         if options['use_mult']:
             if options['mult_name'] is None:
@@ -178,6 +312,12 @@ class NewBalanceComp(ImplicitComponent):
         if options['use_mult']:
             self.declare_partials(of=name, wrt=options['mult_name'], rows=ar, cols=ar)
 
+        self._state_list.append((name, options['lhs_val'], options['lhs_name'],
+                                 options['rhs_val'], options['rhs_name'], options['use_mult'],
+                                 options['mult_name'], options['normalize'], shape))
+        self._res_expr[name] = _residual_expr(options['normalize'], options['use_mult'])
+        self._packed_layout = None
+
     def apply_nonlinear(self, inputs, outputs, residuals):
         """
         Calculate the residual for each balance.
@@ -191,36 +331,182 @@ class NewBalanceComp(ImplicitComponent):
         residuals : Vector
             Unscaled, dimensional residuals written to via residuals[key].
         """
-        for name, options in self._state_vars.items():
+        if self.options['packed']:
+            res = self._packed_eval(inputs)[0]
+            for entry, sl in zip(self._state_list, self._packed_layout[0]):
+                residuals[entry[0]] = res[sl].reshape(entry[-1])
+            return
+
+        for name, lhs_v, lhs_n, rhs_v, rhs_n, use_mult, mult_n, normalize, shape in self._state_list:
             # Get lhs
-            if options['lhs_val'] is not None:
-                lhs = options['lhs_val']
-            else:
-                lhs = inputs[options['lhs_name']]
+            lhs = lhs_v if lhs_v is not None else inputs[lhs_n]
 
             # Get rhs
-            if options['rhs_val'] is not None:
-                rhs = options['rhs_val']
-            else:
-                rhs = inputs[options['rhs_name']]
+            rhs = rhs_v if rhs_v is not None else inputs[rhs_n]
+
+            mult = inputs[mult_n] if use_mult else 1.0
+
+            # The numba kernel also computes the partials in linearize, so it takes the long
+            # balances first and residuals and partials come from the same code
+            if self._use_kernel(shape, lhs, rhs):
+                residuals[name] = self._run_kernel(name, lhs, rhs, mult, normalize, shape)[0].reshape(shape)
+                continue
+
+            # Otherwise long real-valued balances are evaluated in a single numexpr pass, complex
+            # step goes through numpy
+            if ne is not None and shape_to_len(shape) >= _NUMEXPR_MIN_SIZE and \
+                    not np.iscomplexobj(lhs) and not np.iscomplexobj(rhs):
+                residuals[name] = ne.evaluate(self._res_expr[name],
+                                              local_dict={'lhs': lhs, 'rhs': rhs, 'mult': mult})
+                continue
 
             # Set scale factor
-            _scale_factor = np.ones(rhs.shape, dtype=rhs.dtype)
+            scale, _ = self._get_scratch(name, np.shape(rhs), np.result_type(rhs))
+            _scale_factor, _ = _compute_scale(rhs, normalize, scale)
 
-            if options['normalize']:
-                # Indices where the rhs is near zero or not near zero
-                idxs_nz = np.where(cs_abs(rhs) < 2)
-                idxs_nnz = np.where(cs_abs(rhs) >= 2)
+            residuals[name] = (mult * lhs - rhs) * _scale_factor
 
-                # Compute scaling factors
-                _scale_factor[idxs_nnz] = 1.0 / cs_abs(rhs[idxs_nnz])
-                _scale_factor[idxs_nz] = 1.0 / (0.25 * rhs[idxs_nz] ** 2 + 1)
+    def _get_scratch(self, name, shape, dtype):
+        """
+        Return the scale factor buffers of a balance, allocating them on first use.
 
-            if options['use_mult']:
-                mult = inputs[options['mult_name']]
-                residuals[name] = (mult * lhs - rhs) * _scale_factor
-            else:
-                residuals[name] = (lhs - rhs) * _scale_factor
+        The buffers are reallocated when the shape or dtype changes, e.g. under complex step.
+
+        Parameters
+        ----------
+        name : str
+            The name of the state variable of the balance.
+        shape : tuple
+            Shape of the RHS of the balance.
+        dtype : np.dtype
+            Data type of the RHS of the balance.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Buffers for the scale factor and its derivative with respect to rhs.
+        """
+        buffers = self._scratch.get(name)
+        if buffers is None or buffers[0].shape != shape or buffers[0].dtype != dtype:
+            buffers = (np.ones(shape, dtype=dtype), np.zeros(shape, dtype=dtype))
+            self._scratch[name] = buffers
+        return buffers
+
+    def _packed_eval(self, inputs, partials=False):
+        """
+        Evaluate all balances at once over their concatenated lhs, rhs and mult vectors.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        partials : bool
+            If True, also compute the partials with respect to lhs, rhs and mult.
+
+        Returns
+        -------
+        tuple
+            Packed residual, followed by the packed lhs, rhs and mult partials (None if not
+            requested).
+        """
+        dtype = complex if self.under_complex_step else float
+
+        if self._packed_layout is None or self._packed_layout[2].dtype != dtype:
+            slices = []
+            offset = 0
+            for entry in self._state_list:
+                n = shape_to_len(entry[-1])
+                slices.append(slice(offset, offset + n))
+                offset += n
+            mask = np.concatenate([np.full(sl.stop - sl.start, entry[7])
+                                   for entry, sl in zip(self._state_list, slices)] or
+                                  [np.zeros(0, dtype=bool)])
+            self._packed_layout = (slices, mask, np.empty(offset, dtype=dtype),
+                                   np.empty(offset, dtype=dtype), np.empty(offset, dtype=dtype))
+
+        slices, mask, lhs, rhs, mult = self._packed_layout
+
+        # gather the balances into the packed vectors
+        for (name, lhs_v, lhs_n, rhs_v, rhs_n, use_mult, mult_n, normalize, shape), sl in \
+                zip(self._state_list, slices):
+            lhs[sl] = np.ravel(lhs_v if lhs_v is not None else inputs[lhs_n])
+            rhs[sl] = np.ravel(rhs_v if rhs_v is not None else inputs[rhs_n])
+            mult[sl] = np.ravel(inputs[mult_n]) if use_mult else 1.0
+
+        absr = cs_abs(rhs)
+        denom_small = 0.25 * rhs * rhs + 1.0
+        large = mask & (absr >= 2)
+        small = mask & ~(absr >= 2)
+
+        # not normalized entries keep a scale of one
+        scale = np.ones_like(rhs)
+        np.divide(1.0, absr, out=scale, where=large)
+        np.divide(1.0, denom_small, out=scale, where=small)
+
+        diff = mult * lhs - rhs
+        if not partials:
+            return diff * scale, None, None, None
+
+        dscale = np.zeros_like(rhs)
+        np.divide(-np.sign(rhs), rhs * rhs, out=dscale, where=large)
+        np.divide(-0.5 * rhs, denom_small ** 2, out=dscale, where=small)
+
+        return diff * scale, mult * scale, diff * dscale - scale, lhs * scale
+
+    def _use_kernel(self, shape, lhs, rhs):
+        """
+        Return True if the numba kernel should evaluate a balance.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the state variable of the balance.
+        lhs : float or np.ndarray
+            Value of the left-hand-side of the balance.
+        rhs : float or np.ndarray
+            Value of the right-hand-side of the balance.
+
+        Returns
+        -------
+        bool
+            True for long real-valued balances when numba is installed.
+        """
+        return njit is not None and shape_to_len(shape) >= _KERNEL_MIN_SIZE and \
+            not np.iscomplexobj(lhs) and not np.iscomplexobj(rhs)
+
+    def _run_kernel(self, name, lhs, rhs, mult, normalize, shape):
+        """
+        Evaluate the residual and partials of a balance with the numba kernel.
+
+        Parameters
+        ----------
+        name : str
+            The name of the state variable of the balance.
+        lhs : float or np.ndarray
+            Value of the left-hand-side of the balance.
+        rhs : float or np.ndarray
+            Value of the right-hand-side of the balance.
+        mult : float or np.ndarray
+            Value of the LHS multiplier of the balance.
+        normalize : bool
+            Specifies whether the residual is normalized by a quadratic function of the RHS.
+        shape : tuple
+            Shape of the state variable of the balance.
+
+        Returns
+        -------
+        np.ndarray
+            Rows holding the flattened residual and its lhs, rhs and mult partials.
+        """
+        n = shape_to_len(shape)
+        out = self._kernel_scratch.get(name)
+        if out is None:
+            out = self._kernel_scratch[name] = np.empty((4, n))
+
+        flat = [np.broadcast_to(np.asarray(v, dtype=float), shape).ravel() for v in (lhs, rhs, mult)]
+        _balance_kernel(flat[0], flat[1], flat[2], normalize, out[0], out[1], out[2], out[3])
+
+        return out
 
     def linearize(self, inputs, outputs, jacobian):
         """
@@ -235,49 +521,53 @@ class NewBalanceComp(ImplicitComponent):
         jacobian : Jacobian
             Sub-jac components written to jacobian[output_name, input_name].
         """
-        for name, options in self._state_vars.items():
+        if self.options['packed']:
+            _, dlhs, drhs, dmult = self._packed_eval(inputs, partials=True)
+            for entry, sl in zip(self._state_list, self._packed_layout[0]):
+                name, lhs_v, lhs_n, rhs_v, rhs_n, use_mult, mult_n = entry[:7]
+                if lhs_v is None:
+                    jacobian[name, lhs_n] = dlhs[sl]
+                if rhs_v is None:
+                    jacobian[name, rhs_n] = drhs[sl]
+                if use_mult:
+                    jacobian[name, mult_n] = dmult[sl]
+            return
+
+        for name, lhs_v, lhs_n, rhs_v, rhs_n, use_mult, mult_n, normalize, shape in self._state_list:
             # Get lhs
-            if options['lhs_val'] is not None:
-                lhs = options['lhs_val']
-            else:
-                lhs = inputs[options['lhs_name']]
+            lhs = lhs_v if lhs_v is not None else inputs[lhs_n]
 
             # Get rhs
-            if options['rhs_val'] is not None:
-                rhs = options['rhs_val']
-            else:
-                rhs = inputs[options['rhs_name']]
-
-            _scale_factor = np.ones(rhs.shape, dtype=rhs.dtype)
-            _dscale_drhs = np.zeros(rhs.shape, dtype=rhs.dtype)
+            rhs = rhs_v if rhs_v is not None else inputs[rhs_n]
 
-            if options['normalize']:
-                idxs_nz = np.where(cs_abs(rhs) < 2)
-                idxs_nnz = np.where(cs_abs(rhs) >= 2)
+            mult = inputs[mult_n] if use_mult else 1.0
 
-                _scale_factor[idxs_nnz] = 1.0 / cs_abs(rhs[idxs_nnz])
-                _scale_factor[idxs_nz] = 1.0 / (0.25 * rhs[idxs_nz] ** 2 + 1)
+            if self._use_kernel(shape, lhs, rhs):
+                _, out_dlhs, out_drhs, out_dmult = self._run_kernel(name, lhs, rhs, mult, normalize,
+                                                                    shape)
+                if lhs_v is None:
+                    jacobian[name, lhs_n] = out_dlhs
+                if rhs_v is None:
+                    jacobian[name, rhs_n] = out_drhs
+                if use_mult:
+                    jacobian[name, mult_n] = out_dmult
+                continue
 
-                _dscale_drhs[idxs_nnz] = -np.sign(rhs[idxs_nnz]) / rhs[idxs_nnz] ** 2
-                _dscale_drhs[idxs_nz] = -0.5 * rhs[idxs_nz] / (0.25 * rhs[idxs_nz] ** 2 + 1) ** 2
-
-            if options['use_mult']:
-                mult = inputs[options['mult_name']]
-            else:
-                mult = 1.0
+            scale, dscale = self._get_scratch(name, np.shape(rhs), np.result_type(rhs))
+            _scale_factor, _dscale_drhs = _compute_scale(rhs, normalize, scale, dscale)
 
             # Compute derivatives
-            if options['lhs_val'] is None:
+            if lhs_v is None:
                 deriv_lhs = mult * _scale_factor
-                jacobian[name, options['lhs_name']] = deriv_lhs.flatten()
+                jacobian[name, lhs_n] = np.broadcast_to(deriv_lhs, shape).flatten()
 
-            if options['rhs_val'] is None:
+            if rhs_v is None:
                 deriv_rhs = (mult * lhs - rhs) * _dscale_drhs - _scale_factor
-                jacobian[name, options['rhs_name']] = deriv_rhs.flatten()
+                jacobian[name, rhs_n] = np.broadcast_to(deriv_rhs, shape).flatten()
 
-            if options['use_mult']:
+            if use_mult:
                 deriv_mult = lhs * _scale_factor
-                jacobian[name, options['mult_name']] = deriv_mult.flatten()
+                jacobian[name, mult_n] = np.broadcast_to(deriv_mult, shape).flatten()
 
     def guess_nonlinear(self, inputs, outputs, residuals):
         """
@@ -4,12 +4,17 @@ import openmdao.api as om
 import re
 import warnings
 
+# Variable names in a balance expression, e.g. 'lp_shaft.pwr_in_real' or 'burner.Fl_O:tot:T'
+_VAR_RE = re.compile(r'\b[A-Za-z_][A-Za-z0-9_.:]*\b')
+# Operators/whitespace separating the terms of a balance RHS
+_RHS_SPLIT_RE = re.compile(r'[*/+\-\s]+')
+
 
 def extract_variables(expr):
     """
     Helper function to extract variable names from an expression.
     """
-    tokens = re.findall(r'\b[A-Za-z_][A-Za-z0-9_.:]*\b', expr)
+    tokens = _VAR_RE.findall(expr)
     return tokens
 
 
@@ -26,44 +31,27 @@ class NPSSDependent:
     def create_component(self):
         """
         Creates an OpenMDAO component that computes the residual of the dependent equation.
+
+        Returns the component, the variables of the equation and their ExecComp names, so the
+        caller does not have to scan the expressions again.
         """
         # Extract variables from the equations
         lhs_vars = extract_variables(self.eq_lhs)
         rhs_vars = extract_variables(self.eq_rhs)
         all_vars = set(lhs_vars + rhs_vars)
 
-        # Map variable names to valid Python identifiers
-        var_map = {var: var.replace('.', '_') for var in all_vars}
+        # Map variable names to valid Python identifiers, as required by ExecComp
+        var_map = {var: var.replace('.', '_').replace(':', '_') for var in all_vars}
 
         # Replace variable names in the expressions
-        eq_lhs_comp = self.eq_lhs
-        eq_rhs_comp = self.eq_rhs
-        for var in all_vars:
-            eq_lhs_comp = eq_lhs_comp.replace(var, f'inputs["{var_map[var]}"]')
-            eq_rhs_comp = eq_rhs_comp.replace(var, f'inputs["{var_map[var]}"]')
-
-        # Compute the residual expression
-        compute_expression = f'outputs["residual"] = {eq_lhs_comp} - ({eq_rhs_comp})'
-
-        # Define the component class dynamically
-        eq_units = self.eq_units  # Capture in closure
+        eq_lhs_comp = _VAR_RE.sub(lambda m: var_map[m.group(0)], self.eq_lhs)
+        eq_rhs_comp = _VAR_RE.sub(lambda m: var_map[m.group(0)], self.eq_rhs)
 
-        class DependentComponent(om.ExplicitComponent):
-            def setup(self_inner):
-                # Declare output
-                self_inner.add_output('residual', val=0.0, units=eq_units)
-                # Declare inputs
-                for var in all_vars:
-                    var_name = var_map[var]
-                    self_inner.add_input(var_name, val=0.0, units=eq_units)
-                    # Declare partials (use finite difference)
-
-                    self_inner.declare_partials('residual', var_name, method='fd', form='central', step=1e-6)
-
-            def compute(self_inner, inputs, outputs):
-                # Evaluate the residual expression
-                exec(compute_expression, {}, {'inputs': inputs, 'outputs': outputs})
-        return DependentComponent()
+        # Residuals are pointwise in their inputs, so the partials are diagonal
+        var_meta = {var_map[var]: {'val': 0.0, 'units': self.eq_units} for var in all_vars}
+        comp = om.ExecComp(f'residual = {eq_lhs_comp} - ({eq_rhs_comp})', has_diag_partials=True,
+                           residual={'val': 0.0, 'units': self.eq_units}, **var_meta)
+        return comp, all_vars, var_map
 
 
 class NPSSIndependent:
@@ -85,7 +73,7 @@ def addPair(self, balance, Dependent_obj, Independent_obj):
         warnings.warn(message=f'Set a name for the dependent with eq_rhs: {Dependent_obj.eq_rhs} and eq_lhs: {Dependent_obj.eq_lhs}.', category=UserWarning, stacklevel=2)
 
     # Create the Dependent component and add it to the model
-    dep_comp = Dependent_obj.create_component()
+    dep_comp, all_vars, var_map = Dependent_obj.create_component()
     self.add_subsystem(f'dependent_comp_{Dependent_obj.name}', dep_comp)
 
     # Add the balance variable
@@ -107,14 +95,10 @@ def addPair(self, balance, Dependent_obj, Independent_obj):
     else:
         pass
 
-    # Map variable names
-    all_vars = set(extract_variables(Dependent_obj.eq_lhs) + extract_variables(Dependent_obj.eq_rhs))
-    var_map = {var: var.replace('.', '_') for var in all_vars}
-
     # Connect variables to the Dependent component
+    rhs_vars = {v for v in _RHS_SPLIT_RE.split(Dependent_obj.eq_rhs.strip()) if v}
     for var in all_vars:
         var_name = var_map[var]
-        rhs_vars = [v for v in re.split(r'[*/+\-\s]+', Dependent_obj.eq_rhs.strip()) if v]
         if var in rhs_vars:
             # Create an IndepVarComp for the RHS variable if not already in the model
             if not hasattr(self, f'{var_name}_comp'):
@@ -1,21 +1,31 @@
 # collect_outputs.py
 
+import numpy as np
+
+# One record per case, the column order is the order of the summary CSV
+OUTPUT_DTYPE = np.dtype([('CASE', 'i8'),
+                         ('Fn_DESIGN', 'f8'),
+                         ('TSFC_DESIGN', 'f8'),
+                         ('OPR_DESIGN', 'f8')
+                         # Add more outputs as needed
+                         ])
+
+
 def collect_outputs(prob, case_number):
     """
     Collects outputs from the model after running the simulation.
 
     Parameters:
     prob (om.Problem): The OpenMDAO problem instance.
+    case_number (int): Number of the case, written to the CASE column.
 
     Returns:
-    dict: A dictionary of output values.
+    np.void: The record holding the output values.
     """
-    outputs = {
-        'CASE': case_number,
-        'Fn_DESIGN': prob.get_val('DESIGN.perf.Fn', units='lbf'),
-        'TSFC_DESIGN': prob.get_val('DESIGN.perf.TSFC', units='lbm/(lbf*h)'),
-        'OPR_DESIGN': prob.get_val('DESIGN.perf.OPR')
-        # Add more outputs as needed
-    }
+    row = np.empty(1, dtype=OUTPUT_DTYPE)[0]
+    row['CASE'] = case_number
+    row['Fn_DESIGN'] = prob.get_val('DESIGN.perf.Fn', units='lbf')[0]
+    row['TSFC_DESIGN'] = prob.get_val('DESIGN.perf.TSFC', units='lbm/(lbf*h)')[0]
+    row['OPR_DESIGN'] = prob.get_val('DESIGN.perf.OPR')[0]
 
-    return outputs
\ No newline at end of file
+    return row
@@ -1,24 +1,32 @@
 # generate_outputs.py
 
-import pandas as pd
+import csv
 
-def generate_outputs(results, output_filename='engine_outputs.csv'):
+def generate_outputs(results, output_filename='engine_outputs.csv', print_rows=5):
     """
     Generates outputs from the simulation results.
 
+    Rows are written as the cases complete, so a crashed sweep keeps the cases that ran.
+
     Parameters:
-    results (list): A list of dictionaries containing simulation outputs.
+    results (iterable): OUTPUT_DTYPE records containing simulation outputs, one per case.
     output_filename (str): The name of the output CSV file.
+    print_rows (int): Number of leading rows echoed to the console.
 
     Returns:
     None
     """
-    # Convert results to DataFrame
-    results_df = pd.DataFrame(results)
+    print("\nSimulation Results:")
 
-    # Write to CSV
-    results_df.to_csv(output_filename, index=False)
+    with open(output_filename, 'w', newline='') as output_file:
+        writer = None
+        for n, row in enumerate(results):
+            if writer is None:
+                writer = csv.writer(output_file)
+                writer.writerow(row.dtype.names)
+            writer.writerow(row.tolist())
+            output_file.flush()
 
-    # Print the results
-    print("\nSimulation Results:")
-    print(results_df)
\ No newline at end of file
+            # Print the results
+            if n < print_rows:
+                print(dict(zip(row.dtype.names, row.tolist())))
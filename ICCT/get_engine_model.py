@@ -1,5 +1,15 @@
 # get_engine_model.py
 
+import functools
+import importlib
+
+# Engine model name -> (module, class), the module is only imported when the model is requested
+_MODELS = {
+    'HBTF': ('HBTF_engine_model', 'HBTFEngineModel'),
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_engine_model(model_name):
     """
     Returns the engine model class based on the model name.
@@ -10,8 +20,9 @@ def get_engine_model(model_name):
     Returns:
     class: The engine model class.
     """
-    if model_name == 'HBTF':
-        from HBTF_engine_model import HBTFEngineModel
-        return HBTFEngineModel
-    else:
-        raise ValueError(f"Engine model '{model_name}' is not recognized.")
\ No newline at end of file
+    try:
+        module_name, class_name = _MODELS[model_name]
+    except KeyError:
+        raise ValueError(f"Engine model '{model_name}' is not recognized.") from None
+
+    return getattr(importlib.import_module(module_name), class_name)
@@ -2,21 +2,33 @@
 
 import pandas as pd
 
-def read_input_csv(filename='doe_input.csv'):
+from set_model_inputs import _COLUMNS
+
+def read_input_csv(filename='doe_input.csv', dtype=None):
     """
     Reads the input CSV file and returns a pandas DataFrame.
 
+    The pyarrow parser is used when pyarrow is installed, otherwise the default pandas parser.
+
     Parameters:
     filename (str): The path to the CSV file.
+    dtype (str, dict or None): Column dtypes. By default the columns that are model inputs
+        (_VAR_DEFS) are read as float64 instead of being inferred, other columns are inferred.
 
     Returns:
     pd.DataFrame: The input data.
     """
     try:
-        input_data = pd.read_csv(filename)
+        if dtype is None:
+            # the pyarrow parser has no nrows, the header is read with the default one
+            header = pd.read_csv(filename, nrows=0).columns
+            dtype = {col: 'float64' for col in _COLUMNS if col in header}
+        try:
+            input_data = pd.read_csv(filename, dtype=dtype, engine='pyarrow')
+        except ImportError:
+            input_data = pd.read_csv(filename, dtype=dtype)
         print(f"Successfully read input file '{filename}'.")
         return input_data
     except FileNotFoundError:
         print(f"Error: Input file '{filename}' not found.")
         raise
-
@@ -11,10 +11,12 @@ def main():
     engine_model_name = 'HBTF'  # Options: 'HBTF', add more as needed
     thermo_method = 'CEA'  # Options: 'CEA', 'TABULAR'
     summary_output_filename='summary_output.csv'
+    n_workers = 1  # Parallel case processes, e.g. os.cpu_count(); 1 runs every case in this process
+    debug = False  # Write the connection viewer and the full output listing of every case
 
 
     # Run simulations
-    simulation_results = run_simulations(engine_parameters_file, engine_model_name, thermo_method)
+    simulation_results = run_simulations(engine_parameters_file, engine_model_name, thermo_method, n_workers=n_workers, debug=debug)
 
     # Generate outputs
     generate_outputs(simulation_results, output_filename=summary_output_filename)
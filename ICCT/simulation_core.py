@@ -1,123 +1,229 @@
 # simulation_core.py
-import openmdao as om
-from openmdao.test_suite.components.sellar import SellarNoDerivatives
-
-from openmdao.api import Problem
+from openmdao.api import Problem, SolverWarning
 from get_engine_model import get_engine_model
 from read_inputs import read_input_csv
-from set_model_inputs import set_model_inputs
+from set_model_inputs import set_model_inputs, resolve_inputs
 from collect_outputs import collect_outputs
 from viewout_builder import viewer
-from utils import old_files_cleaning
-import contextlib
-import sys
-import logging
+from utils import old_files_cleaning, make_run_dir
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import os
-
-def run_simulations(engine_parameters_file, engine_model_name, thermo_method):
+import warnings
+
+# Buffer size of the report files, a whole viewer report fits so it is written in a few syscalls
+_VIEW_BUFFER = 1 << 20
+
+# Initial guesses of the off-design solver states, written before every case
+_OD_INIT = tuple((pt + suffix, val)
+                 for pt in ('OD_full_pwr', 'OD_part_pwr')
+                 for suffix, val in (('.balance.FAR', 0.02467),
+                                     ('.balance.W', 300),
+                                     ('.balance.BPR', 5.105),
+                                     ('.balance.lp_Nmech', 5000),
+                                     ('.balance.hp_Nmech', 15000),
+                                     ('.hpt.PR', 3.),
+                                     ('.lpt.PR', 4.),
+                                     ('.fan.map.RlineMap', 2.0),
+                                     ('.lpc.map.RlineMap', 2.0),
+                                     ('.hpc.map.RlineMap', 2.0)))
+
+# Problems already set up in this process and a copy of their outputs right after setup,
+# keyed by (engine model name, thermo method)
+_PROBLEMS = {}
+
+
+def _get_problem(engine_model_name, thermo_method, debug=False):
     """
-    Runs simulations based on the input CSV file and engine model.
+    Returns the problem of this process, setting it up on first use.
+
+    The DOE only changes inputs, so every case of a process runs on the same set up problem. The
+    returned copy of its outputs is restored before each case, so no solver state carries over
+    from the case the process ran before.
 
     Parameters:
-    engine_parameters_file (str): Path to the input CSV file.
     engine_model_name (str): Name of the engine model to use.
     thermo_method (str): Thermodynamic method to use ('CEA' or 'TABULAR').
+    debug (bool): If True, write the HTML connection viewer of the new problem.
 
     Returns:
-    list: A list of dictionaries containing simulation outputs.
+    tuple: The set up problem and the copy of its initial outputs.
     """
-    
-    # Read input data
-    input_data = read_input_csv(engine_parameters_file)
-    print('DOE is read...')
-    print(f'Number of cases: {len(input_data)}')
+    key = (engine_model_name, thermo_method)
+    cached = _PROBLEMS.get(key)
+    if cached is None:
+        prob = Problem()
+        prob.model = get_engine_model(engine_model_name)(thermo_method=thermo_method)
+        prob.setup(check=False)
 
-    old_files_cleaning()
+        prob.set_solver_print(level=-1)
+        prob.set_solver_print(level=2, depth=1)
 
+        # The output vector only exists after final_setup, copy it before any case runs
+        prob.final_setup()
+        initial_outputs = prob.model._outputs.asarray().copy()
 
-    # Get the engine model class
-    EngineModelClass = get_engine_model(engine_model_name)
+        if debug:
+            from openmdao.visualization.connection_viewer.viewconns import view_connections
+            view_connections(prob, show_values=True, outfile="connections.html", show_browser=False)
 
-    # Prepare to collect results
-    all_results = []
+        cached = _PROBLEMS[key] = (prob, initial_outputs)
+    return cached
 
 
-    # Loop over each row in the input data
-    for index, row in input_data.iterrows():
-        
-        
-        print(f"\nCASE {index + 1}")
+def _report_paths(outdir, case_number):
+    """
+    Returns the report file paths of one case.
 
-        # Initialize the problem for each simulation
-        prob = Problem()
-        prob.model = EngineModelClass(thermo_method=thermo_method)
-        prob.setup(check=False)
+    Parameters:
+    outdir (str): Output directory of the run.
+    case_number (int): Number of the case.
 
-        prob.set_solver_print(level=-1)
-        prob.set_solver_print(level=2, depth=1)
+    Returns:
+    tuple: Paths of the design, full power, part power and output listing reports.
+    """
+    return tuple(os.path.join(outdir, f'{prefix}{case_number}{suffix}.out')
+                 for prefix, suffix in (('view', '_DES'), ('view', '_100'), ('view', '_part_pwr'),
+                                        ('std_outputs', '')))
 
-        # Set input variables from the CSV row
-        set_model_inputs(prob, row)
-
-        for pt in ['OD_full_pwr', 'OD_part_pwr']:
-            # initial guesses
-            prob[pt + '.balance.FAR'] = 0.02467
-            prob[pt + '.balance.W'] = 300
-            prob[pt + '.balance.BPR'] = 5.105
-            prob[pt + '.balance.lp_Nmech'] = 5000
-            prob[pt + '.balance.hp_Nmech'] = 15000
-            prob[pt + '.hpt.PR'] = 3.
-            prob[pt + '.lpt.PR'] = 4.
-            prob[pt + '.fan.map.RlineMap'] = 2.0
-            prob[pt + '.lpc.map.RlineMap'] = 2.0
-            prob[pt + '.hpc.map.RlineMap'] = 2.0
-
-        #prob.model.list_inputs(prom_name=False, hierarchical=False, out_stream=sys.stdout)
-        #prob.model.list_outputs(prom_name=False, hierarchical=False, out_stream=sys.stdout)
-        prob.set_solver_print(level=-1)
-        prob.set_solver_print(level=2, depth=1)
 
-        # Check partial derivatives
-        #prob.check_partials(compact_print=True)
+def _run_single_case(index, values, report_paths, engine_model_name, thermo_method, debug=False):
+    """
+    Runs one DOE case. Module level so it can be sent to the worker processes.
 
+    Parameters:
+    index (int): Index of the case in the input data.
+    values (np.ndarray): The row of model inputs from resolve_inputs.
+    report_paths (tuple): Report file paths of the case, from _report_paths.
+    engine_model_name (str): Name of the engine model to use.
+    thermo_method (str): Thermodynamic method to use ('CEA' or 'TABULAR').
+    debug (bool): If True, also dump the connection viewer and every model output.
 
-        # Enable debugging for nonlinear and linear solvers
-        #prob.model.nonlinear_solver.options['iprint'] = 2
-        #prob.model.linear_solver.options['iprint'] = 2
+    Returns:
+    np.void: The case output record.
+    """
+    print(f"\nCASE {index + 1}")
+    des_path, full_pwr_path, part_pwr_path, std_outputs_path = report_paths
 
-        #prob.model.list_outputs(prom_name=False,implicit=False, hierarchical=False, out_stream=viewer_file, print_arrays=True)
-        first_pass = True
-        print(f"Running the model...")
+    prob, initial_outputs = _get_problem(engine_model_name, thermo_method, debug)
 
-        om.visualization.connection_viewer.viewconns.view_connections(prob, show_values=True, outfile="sellar_connections.html", show_browser=False)
+    # Start from the state right after setup, whichever case this process ran before
+    prob.model._outputs.asarray()[:] = initial_outputs
 
-        #print(prob.get_val('DESIGN.lp_shaft.pwr_net_real'))
-        #print(prob.get_val('DESIGN.lpt_power_diff'))
-        # Run the model
-        prob.run_model()
+    # Set input variables from the CSV row
+    set_model_inputs(prob, values)
 
-        print(f"Collecting outputs...")
-        if first_pass:
-            with open(f'\nview{index+1}_DES.out', 'w') as viewout_file:
-                viewer(prob, 'DESIGN', file=viewout_file)
-            first_pass = False
-        with open(f'\nview{index + 1}_100.out', 'w') as viewout_file:
-            viewer(prob, 'OD_full_pwr', file=viewout_file)
+    # initial guesses
+    for name, val in _OD_INIT:
+        prob[name] = val
 
-        std_outputs = open(f'\nstd_outputs{index + 1}.out', 'w')
+    #prob.model.list_inputs(prom_name=False, hierarchical=False, out_stream=sys.stdout)
+    #prob.model.list_outputs(prom_name=False, hierarchical=False, out_stream=sys.stdout)
 
-        OD_Uninstalled_viewer_file = open(f'\nview{index + 1}_part_pwr.out', 'w')
+    # Check partial derivatives
+    #prob.check_partials(compact_print=True)
+
+
+    # Enable debugging for nonlinear and linear solvers
+    #prob.model.nonlinear_solver.options['iprint'] = 2
+    #prob.model.linear_solver.options['iprint'] = 2
+
+    #prob.model.list_outputs(prom_name=False,implicit=False, hierarchical=False, out_stream=viewer_file, print_arrays=True)
+    first_pass = True
+    print(f"Running the model...")
+
+    #print(prob.get_val('DESIGN.lp_shaft.pwr_net_real'))
+    #print(prob.get_val('DESIGN.lpt_power_diff'))
+    # Run the model
+    _run_model(prob)
+
+    print(f"Collecting outputs...")
+    if first_pass:
+        with open(des_path, 'w', buffering=_VIEW_BUFFER) as viewout_file:
+            viewer(prob, 'DESIGN', file=viewout_file)
+        first_pass = False
+    with open(full_pwr_path, 'w', buffering=_VIEW_BUFFER) as viewout_file:
+        viewer(prob, 'OD_full_pwr', file=viewout_file)
+
+    with open(part_pwr_path, 'w', buffering=_VIEW_BUFFER) as OD_Uninstalled_viewer_file:
         for PC in [1, 0.9, 0.8, .7]:
             print(f'## PC = {PC}')
             prob['OD_part_pwr.Fn_Target'] = prob['OD_full_pwr.perf.Fn'] * PC
-            prob.run_model()
+            _run_model(prob)
             viewer(prob, 'OD_part_pwr', file=OD_Uninstalled_viewer_file)
 
 
-        prob.model.list_outputs(prom_name=False,implicit=False, hierarchical=False, out_stream=std_outputs, print_arrays=True)
-        # Collect outputs
-        outputs = collect_outputs(prob,index+1)
-        all_results.append(outputs)
-        print('Case ran.')
+    if debug:
+        with open(std_outputs_path, 'w', buffering=_VIEW_BUFFER) as std_outputs:
+            prob.model.list_outputs(prom_name=False,implicit=False, hierarchical=False, out_stream=std_outputs, print_arrays=True)
+    # Collect outputs
+    outputs = collect_outputs(prob,index+1)
+    print('Case ran.')
+
+    return outputs
 
-    return all_results
\ No newline at end of file
+
+def _run_model(prob):
+    """
+    Runs the model with the SolverWarnings of the point solvers silenced, the filter is only
+    installed for the duration of the run.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', SolverWarning)
+        prob.run_model()
+
+
+def run_simulations(engine_parameters_file, engine_model_name, thermo_method, n_workers=1, debug=False):
+    """
+    Runs simulations based on the input CSV file and engine model.
+
+    Parameters:
+    engine_parameters_file (str): Path to the input CSV file.
+    engine_model_name (str): Name of the engine model to use.
+    thermo_method (str): Thermodynamic method to use ('CEA' or 'TABULAR').
+    n_workers (int): Number of worker processes, 1 runs the cases in this process.
+    debug (bool): If True, write the connection viewer once and dump every model output per case.
+
+    Yields:
+    np.void: The OUTPUT_DTYPE record of each case, in input order, as soon as the case has run.
+    """
+    
+    # Read input data
+    input_data = read_input_csv(engine_parameters_file)
+    print('DOE is read...')
+    print(f'Number of cases: {len(input_data)}')
+
+    old_files_cleaning()
+
+
+    # Check the engine model name before starting any case
+    get_engine_model(engine_model_name)
+
+    # Model inputs of every case, resolved once for the whole DOE
+    case_values = resolve_inputs(input_data)
+
+    # The reports of this run go to their own directory
+    outdir = make_run_dir()
+    case_paths = [_report_paths(outdir, index + 1) for index in input_data.index]
+
+    if n_workers > 1:
+        # Cases are independent, each worker runs its share on its own copy of the problem and
+        # every case starts from the post-setup state, whichever worker runs it.
+        # With fork the problem is set up here once and the workers inherit it copy-on-write,
+        # otherwise (spawn) each worker sets it up once on its first case.
+        if 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context('fork')
+            _get_problem(engine_model_name, thermo_method, debug)
+        else:
+            mp_context = None
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp_context) as executor:
+            futures = [executor.submit(_run_single_case, index, values, paths, engine_model_name,
+                                       thermo_method, debug)
+                       for index, values, paths in zip(input_data.index, case_values, case_paths)]
+            for future in futures:
+                yield future.result()
+        return
+
+    # Loop over each row in the input data
+    for index, values, paths in zip(input_data.index, case_values, case_paths):
+        yield _run_single_case(index, values, paths, engine_model_name, thermo_method, debug)
@@ -14,6 +14,13 @@ from balance_setup import Independent, Dependent, Solver
 # Ref: look at the XDSM diagrams in the pyCycle paper and this:
 # http://openmdao.org/twodocs/versions/latest/features/building_blocks/components/balance_comp.html
 
+# Off-design shaft power balances:
+# (dependent, eq_lhs, eq_rhs, independent, varName, dxLimit)
+_OD_BALANCES = (
+    ('LP_Shaft_Pwr_Balance', 'lp_shaft.pwr_in_real', 'lp_shaft.pwr_out_real', 'Des_LP_Nmech', 'LP_Nmech', 500.0),
+    ('HP_Shaft_Pwr_Balance', 'hp_shaft.pwr_in_real', 'hp_shaft.pwr_out_real', 'Des_HP_Nmech', 'HP_Nmech', 500.0),
+)
+
 def add_design_balances(self):
     """Add balances specific to the design point."""
     # Define the balances using the specified format
@@ -110,20 +117,8 @@ def add_off_design_balances(self,solver):
     solver.addDependent(Bypass_Nozzle_Area_Balance)
 
     '''
-    # For LP shaft speed (LP_Nmech) balance
-    LP_Shaft_Pwr_Balance = Dependent('LP_Shaft_Pwr_Balance', eq_lhs='lp_shaft.pwr_in_real',
-                                     eq_rhs='lp_shaft.pwr_out_real')
-    Des_LP_Nmech = Independent('Des_LP_Nmech', varName='LP_Nmech', dxLimit=500.0, dxLimitType='Absolute')
-
-    solver.addIndependent(Des_LP_Nmech)
-    solver.addDependent(LP_Shaft_Pwr_Balance)
-
-    # For HP shaft speed (HP_Nmech) balance
-    HP_Shaft_Pwr_Balance = Dependent('HP_Shaft_Pwr_Balance', eq_lhs='hp_shaft.pwr_in_real',
-                                     eq_rhs='hp_shaft.pwr_out_real')
-    Des_HP_Nmech = Independent('Des_HP_Nmech', varName='HP_Nmech', dxLimit=500.0, dxLimitType='Absolute')
-
-    solver.addIndependent(Des_HP_Nmech)
-    solver.addDependent(HP_Shaft_Pwr_Balance)
-
-
+    # Shaft speeds balance the shaft powers
+    addIndependent, addDependent = solver.addIndependent, solver.addDependent
+    for dep_name, eq_lhs, eq_rhs, indep_name, var_name, dx_limit in _OD_BALANCES:
+        addIndependent(Independent(indep_name, varName=var_name, dxLimit=dx_limit, dxLimitType='Absolute'))
+        addDependent(Dependent(dep_name, eq_lhs=eq_lhs, eq_rhs=eq_rhs))
@@ -53,10 +53,17 @@ Usage Example:
         print(f"{balance_name}: {value}")
 """
 
+import logging
 import re
-from typing import Any, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 import openmdao.api as om
 
+logger = logging.getLogger(__name__)
+
+# Simple regex to match variable names (e.g., 'burner_FAR', 'TrbH_FS41_Tt')
+_VAR_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
 
 class IndependentVariable:
     """
@@ -102,18 +109,28 @@ class SolverConverter:
     """
     Converts NPSS-style solver definitions to PyCycle balance setups.
     """
-    def __init__(self, balance_component: om.BalanceComp, model: om.Group):
+    # Variables of each parsed expression, shared by all converters of the process
+    _PARSE_CACHE: Dict[str, List[str]] = {}
+
+    def __init__(self, balance_component: om.BalanceComp, model: om.Group,
+                 prefix: Optional[str] = None):
         """
         Initialize the SolverConverter with a PyCycle BalanceComp and the model.
 
         Parameters:
             balance_component (om.BalanceComp): The balance component to which solvers will be added.
             model (om.Group): The OpenMDAO model or group where connections will be made.
+            prefix (Optional[str]): Prepended to the names of the subsystems added by setup_solver.
         """
         self.balance = balance_component
         self.model = model
+        self.prefix = prefix
         self.independents: List[IndependentVariable] = []
         self.dependents: List[DependentVariable] = []
+        # (independent, dependent) pairs, extended as soon as both halves of a pair are added
+        self._pairs: List[Tuple[IndependentVariable, DependentVariable]] = []
+        # Number of pairs already set up by earlier setup_solver calls
+        self._n_setup = 0
 
     def add_independent(self, name: str, var_name: str, units: Optional[str] = None,
                        lower: Optional[float] = None, upper: Optional[float] = None,
@@ -129,9 +146,11 @@ class SolverConverter:
             upper (Optional[float]): Upper bound for the variable.
             val (Optional[Any]): Initial guess or value.
         """
-        independent = IndependentVariable(name, var_name, units, lower, upper, val)
+        # The name is part of every connection of the balance, intern it once
+        independent = IndependentVariable(sys.intern(name), var_name, units, lower, upper, val)
         self.independents.append(independent)
-        print(f"Added independent variable: {independent}")
+        self._pair_pending()
+        logger.info("Added independent variable: %s", independent)
 
     def add_dependent(self, name: str, eq_lhs: str, eq_rhs: Any,
                      eq_units: Optional[str] = None, lower: Optional[float] = None,
@@ -149,8 +168,43 @@ class SolverConverter:
             val (Optional[Any]): Initial guess or value.
         """
         dependent = DependentVariable(name, eq_lhs, eq_rhs, eq_units, lower, upper, val)
+        # Parse the expressions once here so setup_solver only dispatches on the results.
+        # A bare variable name is connected directly and needs no scan.
+        dependent._lhs_single = eq_lhs.isidentifier()
+        dependent._lhs_vars = [eq_lhs] if dependent._lhs_single else self._parse_expression(eq_lhs)
+        if isinstance(eq_rhs, str):
+            dependent._rhs_single = eq_rhs.isidentifier()
+            dependent._rhs_vars = [eq_rhs] if dependent._rhs_single else self._parse_expression(eq_rhs)
+        else:
+            dependent._rhs_vars = None
+            dependent._rhs_single = False
         self.dependents.append(dependent)
-        print(f"Added dependent variable: {dependent}")
+        self._pair_pending()
+        logger.info("Added dependent variable: %s", dependent)
+
+    def add_pair(self, independent: Dict[str, Any], dependent: Dict[str, Any]):
+        """
+        Add an independent variable and the dependent variable it solves for.
+
+        Parameters:
+            independent (Dict[str, Any]): Keyword arguments of add_independent.
+            dependent (Dict[str, Any]): Keyword arguments of add_dependent.
+
+        Raises:
+            ValueError: If an independent or dependent variable added earlier is still unpaired.
+        """
+        if len(self.independents) != len(self.dependents):
+            raise ValueError("add_pair needs every independent variable added earlier to have its dependent variable.")
+        self.add_independent(**independent)
+        self.add_dependent(**dependent)
+
+    def _pair_pending(self):
+        """
+        Pair the next independent and dependent variables once both have been added.
+        """
+        n = len(self._pairs)
+        if n < len(self.independents) and n < len(self.dependents):
+            self._pairs.append((self.independents[n], self.dependents[n]))
 
     def _parse_expression(self, expr: str) -> List[str]:
         """
@@ -162,23 +216,62 @@ class SolverConverter:
         Returns:
             List[str]: A list of variable names found in the expression.
         """
-        # Simple regex to match variable names (e.g., 'burner_FAR', 'TrbH_FS41_Tt')
-        pattern = r'[A-Za-z_][A-Za-z0-9_]*'
-        return re.findall(pattern, expr)
+        # Dependents, also of different converters, often share expressions, each one is only
+        # scanned once
+        variables = self._PARSE_CACHE.get(expr)
+        if variables is None:
+            variables = self._PARSE_CACHE[expr] = _VAR_RE.findall(expr)
+        return variables
 
     def setup_solver(self):
         """
         Set up the PyCycle balance solvers based on the added independent and dependent variables.
+
+        The pairs added since the last call are set up. All their LHS expressions share one ExecComp
+        ('<base>_lhs_comp'), all RHS expressions another ('<base>_rhs_comp') and all constant RHS
+        values one IndepVarComp ('<base>_rhs_const'), so the model gets at most three subsystems
+        per call whatever the number of balances. <base> is the name of the first balance of the
+        call, behind the converter prefix if one is set. Balance names are unique, so several
+        converters and several calls do not clash.
         """
-        if len(self.independents) != len(self.dependents):
+        # Every variable is paired when added, an unpaired one is left over in one of the lists
+        n_pairs = len(self._pairs)
+        if n_pairs != len(self.independents) or n_pairs != len(self.dependents):
             raise ValueError("The number of independent variables must match the number of dependent variables.")
 
-        for indep, dep in zip(self.independents, self.dependents):
+        pairs = self._pairs[self._n_setup:]
+        if not pairs:
+            return
+        self._n_setup = n_pairs
+
+        base = pairs[0][0].name
+        if self.prefix:
+            base = f'{self.prefix}_{base}'
+        lhs_comp_name = f'{base}_lhs_comp'
+        rhs_comp_name = f'{base}_rhs_comp'
+        const_comp_name = f'{base}_rhs_const'
+
+        lhs_exprs: List[str] = []
+        rhs_exprs: List[str] = []
+        # Constant RHS values, each distinct value is one output shared by its balances
+        const_rhs: Dict[Any, str] = {}
+        connections: List[Tuple[str, str]] = []
+
+        # Bound methods used in the loops, looked up once
+        add_balance = self.balance.add_balance
+        add_connection = connections.append
+
+        for indep, dep in pairs:
             # Use the independent variable's name as the balance name
             balance_name = indep.name
+            # Names of this balance, each built once and shared by its connections
+            bal_lhs = f'balance.lhs:{balance_name}'
+            bal_rhs = f'balance.rhs:{balance_name}'
+            lhs_name = f'{balance_name}_lhs'
+            rhs_name = f'{balance_name}_rhs'
 
             # Add a balance to the balance component
-            self.balance.add_balance(
+            add_balance(
                 name=balance_name,
                 val=indep.val if indep.val is not None else 1.0,
                 lower=indep.lower,
@@ -188,77 +281,79 @@ class SolverConverter:
 
             # Connect the BalanceComp's output to the independent variable's input
             # balance.balance_name (output) -> independent.var_name (input)
-            self.model.connect(f'balance.{balance_name}', indep.var_name)
+            add_connection((f'balance.{balance_name}', indep.var_name))
 
             # Handle the LHS: connect dep.eq_lhs to balance.lhs:balance_name
-            lhs_expr = dep.eq_lhs
-            lhs_vars = self._parse_expression(lhs_expr)
-
-            if len(lhs_vars) == 1:
-                lhs_var = lhs_vars[0]
+            if dep._lhs_single:
                 # Connect the single variable to balance.lhs:balance_name
-                self.model.connect(lhs_var, f'balance.lhs:{balance_name}')
+                add_connection((dep._lhs_vars[0], bal_lhs))
             else:
-                # Create an ExecComp to compute the LHS expression
-                exec_comp_name = f'{balance_name}_lhs_comp'
-                expr = f'{balance_name}_lhs = {lhs_expr}'
-                self.model.add_subsystem(
-                    exec_comp_name,
-                    om.ExecComp(expr),
-                    promotes_outputs=[f'{balance_name}_lhs']
-                )
+                # Compute the LHS expression in the shared LHS ExecComp
+                lhs_exprs.append(f'{lhs_name} = {dep.eq_lhs}')
                 # Connect all variables in the expression to the ExecComp
-                for var in lhs_vars:
+                for var in dep._lhs_vars:
                     # Replace dots with underscores for valid variable names in ExecComp
-                    var_exec = var.replace('.', '_')
-                    self.model.connect(var, f'{exec_comp_name}.{var_exec}')
+                    add_connection((var, f'{lhs_comp_name}.{var.replace(".", "_")}'))
                 # Connect the ExecComp output to balance.lhs:balance_name
-                self.model.connect(f'{balance_name}_lhs', f'balance.lhs:{balance_name}')
+                add_connection((lhs_name, bal_lhs))
 
             # Handle the RHS: connect dep.eq_rhs to balance.rhs:balance_name
-            if isinstance(dep.eq_rhs, (int, float, complex)):
-                # If eq_rhs is a constant, add an IndepVarComp
-                const_comp_name = f'{balance_name}_rhs_const'
-                self.model.add_subsystem(
-                    const_comp_name,
-                    om.IndepVarComp(f'{balance_name}_rhs', val=dep.eq_rhs),
-                    promotes_outputs=[f'{balance_name}_rhs']
-                )
+            # Plain floats and ints are the usual constants, check them before the isinstance walk
+            rhs_type = type(dep.eq_rhs)
+            if rhs_type is float or rhs_type is int or isinstance(dep.eq_rhs, (int, float, complex)):
+                # If eq_rhs is a constant, add it to the shared IndepVarComp unless an earlier
+                # balance already uses the same value
+                const_name = const_rhs.setdefault(dep.eq_rhs, rhs_name)
                 # Connect the constant to balance.rhs:balance_name
-                self.model.connect(f'{balance_name}_rhs', f'balance.rhs:{balance_name}')
-            elif isinstance(dep.eq_rhs, str):
-                rhs_expr = dep.eq_rhs
-                rhs_vars = self._parse_expression(rhs_expr)
-                if len(rhs_vars) == 1:
-                    rhs_var = rhs_vars[0]
+                add_connection((const_name, bal_rhs))
+            elif dep._rhs_vars is not None:
+                if dep._rhs_single:
                     # Connect the single variable to balance.rhs:balance_name
-                    self.model.connect(rhs_var, f'balance.rhs:{balance_name}')
+                    add_connection((dep._rhs_vars[0], bal_rhs))
                 else:
-                    # Create an ExecComp to compute the RHS expression
-                    exec_comp_name = f'{balance_name}_rhs_comp'
-                    expr = f'{balance_name}_rhs = {rhs_expr}'
-                    self.model.add_subsystem(
-                        exec_comp_name,
-                        om.ExecComp(expr),
-                        promotes_outputs=[f'{balance_name}_rhs']
-                    )
+                    # Compute the RHS expression in the shared RHS ExecComp
+                    rhs_exprs.append(f'{rhs_name} = {dep.eq_rhs}')
                     # Connect all variables in the expression to the ExecComp
-                    for var in rhs_vars:
-                        var_exec = var.replace('.', '_')
-                        self.model.connect(var, f'{exec_comp_name}.{var_exec}')
+                    for var in dep._rhs_vars:
+                        add_connection((var, f'{rhs_comp_name}.{var.replace(".", "_")}'))
                     # Connect the ExecComp output to balance.rhs:balance_name
-                    self.model.connect(f'{balance_name}_rhs', f'balance.rhs:{balance_name}')
+                    add_connection((rhs_name, bal_rhs))
             else:
                 raise TypeError(f"Unsupported type for eq_rhs: {type(dep.eq_rhs)}")
 
-            print(f"Set up balance '{balance_name}' with lhs '{dep.eq_lhs}' and rhs '{dep.eq_rhs}' by varying '{indep.var_name}'.")
+            logger.info("Set up balance '%s' with lhs '%s' and rhs '%s' by varying '%s'.",
+                        balance_name, dep.eq_lhs, dep.eq_rhs, indep.var_name)
+
+        if lhs_exprs:
+            self.model.add_subsystem(lhs_comp_name, om.ExecComp(lhs_exprs),
+                                     promotes_outputs=[expr.split(' = ', 1)[0] for expr in lhs_exprs])
+        if rhs_exprs:
+            self.model.add_subsystem(rhs_comp_name, om.ExecComp(rhs_exprs),
+                                     promotes_outputs=[expr.split(' = ', 1)[0] for expr in rhs_exprs])
+        if const_rhs:
+            const_comp = om.IndepVarComp()
+            for const_val, const_name in const_rhs.items():
+                const_comp.add_output(const_name, val=const_val)
+            self.model.add_subsystem(const_comp_name, const_comp,
+                                     promotes_outputs=list(const_rhs.values()))
+
+        # A variable used by several expressions of one ExecComp is a single input, connect it once
+        connect = self.model.connect
+        for src, tgt in dict.fromkeys(connections):
+            connect(src, tgt)
 
 # example_usage.py
 
 import openmdao.api as om
 from solver_converter import SolverConverter
 
-def main():
+def build_example_problem():
+    """
+    Build the example problem: two balances on dummy components, solved by a Newton solver.
+
+    Returns:
+        Tuple[om.Problem, SolverConverter]: The problem, not yet set up, and its converter.
+    """
     # Create an OpenMDAO problem and model
     prob = om.Problem()
     model = prob.model
@@ -303,23 +398,18 @@ def main():
     )
 
     # Add Components to the Model
-    # Ensure all promoted outputs have unique names to prevent conflicts
-
-    # Dummy Burner component
-    burner = om.IndepVarComp('burner_FAR', val=0.017, units=None)
-    model.add_subsystem('burner', burner, promotes_outputs=['burner_FAR'])
+    # Ensure all promoted outputs have unique names to prevent conflicts.
+    # The balances drive the inputs of the dummy components.
 
-    # Dummy TrbH component
-    trbH = om.IndepVarComp('TrbH_FS41_Tt', val=3000.0, units=None)
-    model.add_subsystem('TrbH', trbH, promotes_outputs=['TrbH_FS41_Tt'])
+    # Dummy Burner/TrbH component: the turbine inlet temperature follows the fuel-air ratio
+    trbH = om.ExecComp('TrbH_FS41_Tt = 3000.0 * burner_FAR / 0.017')
+    model.add_subsystem('TrbH', trbH, promotes=['TrbH_FS41_Tt', 'burner_FAR'])
 
-    # Dummy Splitter component
-    splitter = om.IndepVarComp('splitter_BPR', val=2.5, units='inch**2')
-    model.add_subsystem('splitter', splitter, promotes_outputs=['splitter_BPR'])
-
-    # Dummy NozSec component
-    nozSec = om.IndepVarComp('NozSec_Fl_I_Pt', val=1.1, units=None)
-    model.add_subsystem('NozSec', nozSec, promotes_outputs=['NozSec_Fl_I_Pt'])
+    # Dummy Splitter/NozSec component: the secondary nozzle pressure follows the splitter BPR
+    nozSec = om.ExecComp('NozSec_Fl_I_Pt = 0.44 * splitter_BPR',
+                         splitter_BPR={'units': 'inch**2'},
+                         NozSec_Fl_I_Pt={'units': None})
+    model.add_subsystem('NozSec', nozSec, promotes=['NozSec_Fl_I_Pt', 'splitter_BPR'])
 
     # Dummy NozPri component
     nozPri = om.IndepVarComp('NozPri_Fl_I_Pt', val=1.0, units=None)
@@ -327,6 +417,16 @@ def main():
 
     # Setup the solvers
     converter.setup_solver()
+
+    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=20, iprint=0)
+    model.linear_solver = om.DirectSolver()
+
+    return prob, converter
+
+
+def main():
+    prob, converter = build_example_problem()
+
     # Setup and run the problem
     prob.setup()
     prob.check_setup(show_browser=False)
@@ -341,4 +441,4 @@ def main():
         print(f"{balance_name}: {value}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
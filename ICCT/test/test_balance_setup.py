@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials
+
+# the ICCT modules import each other by module name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from balance_setup import NPSSDependent, NPSSIndependent, addPair
+
+
+class PairGroup(om.Group):
+
+    def setup(self):
+        burner = om.IndepVarComp()
+        burner.add_output('Fl_O:tot:T', val=3000.0)
+        burner.add_output('Fl_O:tot:P', val=50.0)
+        self.add_subsystem('burner', burner)
+        self.add_subsystem('sink', om.ExecComp('y = 2.0 * FAR'))
+        balance = self.add_subsystem('balance', om.BalanceComp())
+
+        dependent = NPSSDependent(eq_lhs='burner.Fl_O:tot:T * burner.Fl_O:tot:P / 100.0',
+                                  eq_rhs='T_target', name='T4')
+        independent = NPSSIndependent(name='FAR', varName='sink.FAR', val=0.02)
+        addPair(self, balance, dependent, independent)
+
+
+class AddPairTestCase(unittest.TestCase):
+
+    def test_dotted_and_colon_names(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('pair', PairGroup())
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('pair.T_target', 1200.0)
+        prob.run_model()
+
+        # residual = T * P / 100 - T_target = 3000 * 50 / 100 - 1200
+        assert_near_equal(prob.get_val('pair.dependent_comp_T4.burner_Fl_O_tot_T'), 3000.0, 1e-12)
+        assert_near_equal(prob.get_val('pair.dependent_comp_T4.residual'), 300.0, 1e-12)
+        assert_near_equal(prob.get_val('pair.balance.lhs:FAR'), 300.0, 1e-12)
+        assert_near_equal(prob.get_val('pair.sink.y'), 0.04, 1e-12)
+
+        partials = prob.check_partials(includes=['*dependent_comp_T4'], method='cs', out_stream=None)
+        assert_check_partials(partials)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import numpy as np
+import unittest
+from unittest import mock
+import os
+import sys
+
+from openmdao.api import Problem
+from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials
+
+# the ICCT modules import each other by module name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import NewBalanceComp as new_balance_comp
+from NewBalanceComp import NewBalanceComp
+
+
+class NewBalanceCompTestCase(unittest.TestCase):
+
+    def test_scalar_rhs_val_large(self):
+        # |rhs| >= 2 is normalized by 1 / |rhs|
+        prob = Problem()
+        prob.model.add_subsystem('balance', NewBalanceComp('x', rhs_val=5.0))
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('balance.lhs:x', 3.0)
+        prob.run_model()
+        prob.model.run_apply_nonlinear()
+
+        assert_near_equal(prob.model.balance._residuals['x'], -0.4, 1e-12)
+
+        partials = prob.check_partials(method='cs', out_stream=None)
+        assert_check_partials(partials)
+        assert_near_equal(partials['balance'][('x', 'lhs:x')]['J_fwd'], [[0.2]], 1e-12)
+
+    def test_scalar_rhs_val_small(self):
+        # |rhs| < 2 is normalized by 1 / (0.25 * rhs**2 + 1)
+        prob = Problem()
+        prob.model.add_subsystem('balance', NewBalanceComp('x', rhs_val=1.0))
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('balance.lhs:x', 3.0)
+        prob.run_model()
+        prob.model.run_apply_nonlinear()
+
+        assert_near_equal(prob.model.balance._residuals['x'], 1.6, 1e-12)
+
+    def test_packed_option(self):
+        def build(packed):
+            prob = Problem()
+            comp = NewBalanceComp('x', rhs_val=5.0, packed=packed)
+            comp.add_balance('y', use_mult=True, shape=3)
+            comp.add_balance('z', normalize=False)
+            prob.model.add_subsystem('balance', comp)
+            prob.setup(force_alloc_complex=True)
+            prob.set_val('balance.lhs:x', 3.0)
+            prob.set_val('balance.lhs:y', np.array([1.0, -4.0, 0.5]))
+            prob.set_val('balance.rhs:y', np.array([0.5, 3.0, -10.0]))
+            prob.set_val('balance.mult:y', np.array([2.0, 1.5, 1.0]))
+            prob.set_val('balance.lhs:z', 7.0)
+            prob.set_val('balance.rhs:z', 2.0)
+            prob.run_model()
+            prob.model.run_apply_nonlinear()
+            return prob, comp
+
+        prob_packed, comp_packed = build(True)
+        prob_plain, comp_plain = build(False)
+
+        self.assertTrue(comp_packed.options['packed'])
+        self.assertFalse(comp_plain.options['packed'])
+
+        for name in ('x', 'y', 'z'):
+            assert_near_equal(comp_packed._residuals[name], comp_plain._residuals[name], 1e-12)
+
+        partials_packed = prob_packed.check_partials(method='cs', out_stream=None)
+        partials_plain = prob_plain.check_partials(method='cs', out_stream=None)
+        assert_check_partials(partials_packed)
+        for key, data in partials_plain['balance'].items():
+            assert_near_equal(partials_packed['balance'][key]['J_fwd'], data['J_fwd'], 1e-12)
+
+
+class LongBalanceTestCase(unittest.TestCase):
+    """
+    Balances long enough for the optional numexpr and numba paths, checked against plain numpy.
+    """
+
+    n = 2 * max(new_balance_comp._NUMEXPR_MIN_SIZE, new_balance_comp._KERNEL_MIN_SIZE)
+
+    def _evaluate(self, ne, njit):
+        with mock.patch.object(new_balance_comp, 'ne', ne), \
+                mock.patch.object(new_balance_comp, 'njit', njit):
+            prob = Problem()
+            comp = NewBalanceComp()
+            comp.add_balance('x', use_mult=True, shape=self.n)
+            comp.add_balance('y', normalize=False, shape=self.n)
+            comp.add_balance('z', rhs_val=5.0, shape=self.n)
+            prob.model.add_subsystem('balance', comp)
+            prob.setup(force_alloc_complex=True)
+
+            rng = np.random.default_rng(0)
+            for name in ('lhs:x', 'rhs:x', 'lhs:y', 'rhs:y', 'lhs:z'):
+                # rhs values on both sides of |rhs| = 2
+                prob.set_val(f'balance.{name}', rng.uniform(-5.0, 5.0, self.n))
+            prob.set_val('balance.mult:x', rng.uniform(0.5, 2.0, self.n))
+
+            prob.run_model()
+            prob.model.run_apply_nonlinear()
+            residuals = {name: comp._residuals[name].copy() for name in ('x', 'y', 'z')}
+            partials = prob.check_partials(method='cs', out_stream=None)
+
+        return residuals, partials
+
+    def _compare_with_numpy(self, ne, njit):
+        residuals, partials = self._evaluate(ne, njit)
+        ref_residuals, ref_partials = self._evaluate(None, None)
+
+        for name, ref in ref_residuals.items():
+            assert_near_equal(residuals[name], ref, 1e-12)
+
+        assert_check_partials(partials)
+        for key, data in ref_partials['balance'].items():
+            assert_near_equal(partials['balance'][key]['J_fwd'], data['J_fwd'], 1e-12)
+
+    @unittest.skipUnless(new_balance_comp.njit, "numba is required.")
+    def test_numba_kernel(self):
+        self._compare_with_numpy(None, new_balance_comp.njit)
+
+    @unittest.skipUnless(new_balance_comp.ne, "numexpr is required.")
+    def test_numexpr_residuals(self):
+        self._compare_with_numpy(new_balance_comp.ne, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import sys
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+
+# the ICCT modules import each other by module name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from solver_converter import SolverConverter, build_example_problem
+
+
+class SolverConverterTestCase(unittest.TestCase):
+
+    def test_example_model(self):
+        prob, converter = build_example_problem()
+        prob.setup()
+        prob.run_model()
+
+        # TrbH_FS41_Tt = 3000 * FAR / 0.017 = 2750 and 0.44 * BPR / 1.0 = 1.1
+        assert_near_equal(prob.get_val('balance.Burner_FAR'), 2750 * 0.017 / 3000, 1e-8)
+        assert_near_equal(prob.get_val('balance.Extraction_Ratio', units='inch**2'), 2.5, 1e-8)
+        assert_near_equal(prob.get_val('TrbH_FS41_Tt'), 2750, 1e-8)
+
+        # the LHS expression goes through the shared ExecComp named after the first balance
+        assert_near_equal(prob.get_val('Burner_FAR_lhs_comp.Extraction_Ratio_lhs'), 1.1, 1e-8)
+
+    def _build_two_batches(self, second_converter):
+        prob = om.Problem()
+        model = prob.model
+
+        balance = om.BalanceComp()
+        model.add_subsystem('balance', balance)
+
+        model.add_subsystem('y1_comp', om.ExecComp('y1 = 2.0 * x1'), promotes=['*'])
+        model.add_subsystem('y2_comp', om.ExecComp('y2 = 3.0 * x3'), promotes=['*'])
+        model.add_subsystem('y3_comp', om.ExecComp('y3 = 4.0 * x2'), promotes=['*'])
+
+        first = SolverConverter(balance, model)
+        first.add_independent(name='X1', var_name='x1', val=1.0)
+        first.add_dependent(name='Y1', eq_lhs='y1 + y3', eq_rhs=10.0)
+        first.setup_solver()
+
+        # the same subsystem names would clash without the prefix or the per-call names
+        second = SolverConverter(balance, model, prefix='od') if second_converter else first
+        second.add_independent(name='X3', var_name='x3', val=1.0)
+        second.add_dependent(name='Y2', eq_lhs='y2 - y3', eq_rhs=5.0)
+        second.add_independent(name='X2', var_name='x2', val=1.0)
+        second.add_dependent(name='Y3', eq_lhs='y3', eq_rhs=4.0)
+        second.setup_solver()
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=20, iprint=0)
+        model.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        prob.run_model()
+        return prob
+
+    def _check_two_batches(self, prob):
+        # 4 * x2 = 4, 2 * x1 + 4 * x2 = 10 and 3 * x3 - 4 * x2 = 5
+        assert_near_equal(prob.get_val('balance.X2'), 1.0, 1e-8)
+        assert_near_equal(prob.get_val('balance.X1'), 3.0, 1e-8)
+        assert_near_equal(prob.get_val('balance.X3'), 3.0, 1e-8)
+
+    def test_two_converters_on_one_model(self):
+        self._check_two_batches(self._build_two_batches(second_converter=True))
+
+    def test_setup_solver_twice(self):
+        self._check_two_batches(self._build_two_batches(second_converter=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# the ICCT modules import each other by module name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from utils import old_files_cleaning, make_run_dir
+
+
+class OldFilesCleaningTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.runs_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _make_dirs(self, *names):
+        for name in names:
+            os.mkdir(os.path.join(self.runs_dir, name))
+
+    def test_keeps_unrelated_entries(self):
+        self._make_dirs('20260101T000000', '20260101T000001', 'my_results', '2026')
+        with open(os.path.join(self.runs_dir, '20260101T000002'), 'w'):
+            pass
+
+        old_files_cleaning(self.runs_dir, keep=0)
+
+        self.assertEqual(sorted(os.listdir(self.runs_dir)), ['2026', '20260101T000002', 'my_results'])
+
+    def test_keeps_most_recent_runs(self):
+        # _10 is more recent than _2 although it sorts first as a string
+        self._make_dirs('20260101T000000', '20260101T000000_2', '20260101T000000_10',
+                        '20251231T235959_1')
+
+        old_files_cleaning(self.runs_dir, keep=2)
+
+        self.assertEqual(sorted(os.listdir(self.runs_dir)), ['20260101T000000_10', '20260101T000000_2'])
+
+    def test_missing_runs_dir(self):
+        old_files_cleaning(os.path.join(self.runs_dir, 'missing'))
+
+    def test_make_run_dir_unique(self):
+        first = make_run_dir(self.runs_dir)
+        second = make_run_dir(self.runs_dir)
+
+        self.assertNotEqual(first, second)
+        self.assertTrue(os.path.isdir(first))
+        self.assertTrue(os.path.isdir(second))
+
+
+if __name__ == "__main__":
+    unittest.main()
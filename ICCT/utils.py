@@ -1,17 +1,48 @@
 import os
+import re
+import shutil
+import time
 
+# Directory holding the report directory of each run
+RUNS_DIR = 'runs'
 
-def old_files_cleaning():
-    current_dir = os.getcwd()
+# Report directories of the most recent runs kept by old_files_cleaning
+_KEPT_RUNS = 5
+
+# Names make_run_dir gives the run directories, a UTC timestamp and an optional same-second suffix
+_RUN_DIR_RE = re.compile(r'^(\d{8}T\d{6})(?:_(\d+))?$')
 
-    # Remove old view output files
-    for file_name in os.listdir(current_dir):
-        try:
 
-            if file_name.endswith('.out'):
-                file_path = os.path.join(current_dir, file_name)
-                os.remove(file_path)
+def old_files_cleaning(runs_dir=RUNS_DIR, keep=_KEPT_RUNS):
+    # Remove the report directories of old runs, keeping the most recent ones.
+    # Only directories named by make_run_dir are touched, anything else in runs_dir is left alone.
+    old_runs = []
+    try:
+        with os.scandir(runs_dir) as entries:
+            for entry in entries:
+                match = _RUN_DIR_RE.match(entry.name)
+                if match and entry.is_dir(follow_symlinks=False):
+                    stamp, suffix = match.groups()
+                    old_runs.append(((stamp, int(suffix or 0)), entry.path))
+    except FileNotFoundError:
+        return
+    old_runs.sort()
+    for _, path in old_runs[:max(len(old_runs) - keep, 0)]:
+        try:
+            shutil.rmtree(path)
         except OSError as e:
-            print(f'Error removing file {file_name}: {e.strerror}')
+            print(f'Error removing directory {path}: {e.strerror}')
 
 
+def make_run_dir(runs_dir=RUNS_DIR):
+    # Create the report directory of a new run, runs started in the same second get a suffix
+    stamp = time.strftime('%Y%m%dT%H%M%S', time.gmtime())
+    outdir = os.path.join(runs_dir, stamp)
+    n = 1
+    while True:
+        try:
+            os.makedirs(outdir)
+            return outdir
+        except FileExistsError:
+            outdir = os.path.join(runs_dir, f'{stamp}_{n}')
+            n += 1
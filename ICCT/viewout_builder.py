@@ -1,62 +1,76 @@
+import functools
 import sys
 import pycycle.api as pyc
 
-def viewer(prob, pt, file=sys.stdout):
+
+# Prob key suffixes read by viewer, the point name is prepended per point
+_DES_STATE_SUFFIXES = ('.fc.Fl_O:stat:MN', '.balance.lpt_PR', '.balance.hpt_PR', '.balance.FAR')
+_OD_STATE_SUFFIXES = ('.fc.Fl_O:stat:MN', '.lpt.PR', '.hpt.PR', '.balance.FAR')
+_PERF_SUFFIXES = tuple('.' + v for v in ('fc.alt', 'inlet.Fl_O:stat:W', 'perf.Fn', 'perf.Fg',
+                                         'inlet.F_ram', 'perf.OPR', 'perf.TSFC', 'splitter.BPR'))
+_FS_SUFFIXES = tuple('.' + fs for fs in ('fc.Fl_O', 'inlet.Fl_O', 'fan.Fl_O', 'splitter.Fl_O1',
+                                         'splitter.Fl_O2', 'duct4.Fl_O', 'lpc.Fl_O', 'duct6.Fl_O',
+                                         'hpc.Fl_O', 'bld3.Fl_O', 'burner.Fl_O', 'hpt.Fl_O',
+                                         'duct11.Fl_O', 'lpt.Fl_O', 'duct13.Fl_O', 'core_nozz.Fl_O',
+                                         'byp_bld.Fl_O', 'duct15.Fl_O', 'byp_nozz.Fl_O'))
+_COMP_SUFFIXES = tuple('.' + c for c in ('fan', 'lpc', 'hpc'))
+_BURNER_SUFFIXES = ('.burner',)
+_TURB_SUFFIXES = tuple('.' + t for t in ('hpt', 'lpt'))
+_NOZ_SUFFIXES = tuple('.' + n for n in ('core_nozz', 'byp_nozz'))
+_SHAFT_SUFFIXES = tuple('.' + s for s in ('hp_shaft', 'lp_shaft'))
+_BLEED_SUFFIXES = tuple('.' + b for b in ('hpc', 'bld3', 'byp_bld'))
+
+
+@functools.lru_cache(maxsize=8)
+def _names_for(pt):
+    """
+    Build the prob keys read by viewer for one point, once per point.
+    """
+    state_suffixes = _DES_STATE_SUFFIXES if pt == 'DESIGN' else _OD_STATE_SUFFIXES
+    return tuple([pt + s for s in suffixes]
+                 for suffixes in (state_suffixes, _PERF_SUFFIXES, _FS_SUFFIXES, _COMP_SUFFIXES,
+                                  _BURNER_SUFFIXES, _TURB_SUFFIXES, _NOZ_SUFFIXES, _SHAFT_SUFFIXES,
+                                  _BLEED_SUFFIXES))
+
+
+def viewer(prob, pt, file=sys.stdout, verbose=True):
     """
-    print a report of all the relevant cycle properties
+    print a report of all the relevant cycle properties, nothing is formatted when verbose is
+    False
     """
+    if not verbose:
+        return
+
+    (state_keys, perf_keys, fs_full_names, comp_full_names, burner_full_names, turb_full_names,
+     noz_full_names, shaft_full_names, bleed_full_names) = _names_for(pt)
+
+    # OpenMDAO has no multi-variable getter, bind the single one once for the summary lookups
+    get_val = prob.get_val
+    MN, LPT_PR, HPT_PR, FAR = [get_val(key) for key in state_keys]
+
+    summary_data = (MN,) + tuple(get_val(key) for key in perf_keys)
+
+    # Header block in one write, the file is flushed once when the report is complete
+    file.write("\n\n\n"
+               "----------------------------------------------------------------------------\n"
+               f"                              POINT: {pt}\n"
+               "----------------------------------------------------------------------------\n"
+               "                       PERFORMANCE CHARACTERISTICS\n"
+               "    Mach      Alt       W      Fn      Fg    Fram     OPR     TSFC      BPR \n"
+               " %7.5f  %7.1f %7.3f %7.1f %7.1f %7.1f %7.3f  %7.5f  %7.3f\n" % summary_data)
 
-    if pt == 'DESIGN':
-        MN = prob['DESIGN.fc.Fl_O:stat:MN']
-        LPT_PR = prob['DESIGN.balance.lpt_PR']
-        HPT_PR = prob['DESIGN.balance.hpt_PR']
-        FAR = prob['DESIGN.balance.FAR']
-    else:
-        MN = prob[pt+'.fc.Fl_O:stat:MN']
-        LPT_PR = prob[pt+'.lpt.PR']
-        HPT_PR = prob[pt+'.hpt.PR']
-        FAR = prob[pt+'.balance.FAR']
-
-    summary_data = (MN, prob[pt+'.fc.alt'], prob[pt+'.inlet.Fl_O:stat:W'], prob[pt+'.perf.Fn'],
-                        prob[pt+'.perf.Fg'], prob[pt+'.inlet.F_ram'], prob[pt+'.perf.OPR'],
-                        prob[pt+'.perf.TSFC'], prob[pt+'.splitter.BPR'])
-
-    print(file=file, flush=True)
-    print(file=file, flush=True)
-    print(file=file, flush=True)
-    print("----------------------------------------------------------------------------", file=file, flush=True)
-    print("                              POINT:", pt, file=file, flush=True)
-    print("----------------------------------------------------------------------------", file=file, flush=True)
-    print("                       PERFORMANCE CHARACTERISTICS", file=file, flush=True)
-    print("    Mach      Alt       W      Fn      Fg    Fram     OPR     TSFC      BPR ", file=file, flush=True)
-    print(" %7.5f  %7.1f %7.3f %7.1f %7.1f %7.1f %7.3f  %7.5f  %7.3f" %summary_data, file=file, flush=True)
-
-
-    fs_names = ['fc.Fl_O', 'inlet.Fl_O', 'fan.Fl_O', 'splitter.Fl_O1', 'splitter.Fl_O2',
-                'duct4.Fl_O', 'lpc.Fl_O', 'duct6.Fl_O', 'hpc.Fl_O', 'bld3.Fl_O', 'burner.Fl_O',
-                'hpt.Fl_O', 'duct11.Fl_O', 'lpt.Fl_O', 'duct13.Fl_O', 'core_nozz.Fl_O', 'byp_bld.Fl_O',
-                'duct15.Fl_O', 'byp_nozz.Fl_O']
-    fs_full_names = [f'{pt}.{fs}' for fs in fs_names]
     pyc.print_flow_station(prob, fs_full_names, file=file)
 
-    comp_names = ['fan', 'lpc', 'hpc']
-    comp_full_names = [f'{pt}.{c}' for c in comp_names]
     pyc.print_compressor(prob, comp_full_names, file=file)
 
-    pyc.print_burner(prob, [f'{pt}.burner'], file=file)
+    pyc.print_burner(prob, burner_full_names, file=file)
 
-    turb_names = ['hpt', 'lpt']
-    turb_full_names = [f'{pt}.{t}' for t in turb_names]
     pyc.print_turbine(prob, turb_full_names, file=file)
 
-    noz_names = ['core_nozz', 'byp_nozz']
-    noz_full_names = [f'{pt}.{n}' for n in noz_names]
     pyc.print_nozzle(prob, noz_full_names, file=file)
 
-    shaft_names = ['hp_shaft', 'lp_shaft']
-    shaft_full_names = [f'{pt}.{s}' for s in shaft_names]
     pyc.print_shaft(prob, shaft_full_names, file=file)
 
-    bleed_names = ['hpc', 'bld3', 'byp_bld']
-    bleed_full_names = [f'{pt}.{b}' for b in bleed_names]
-    pyc.print_bleed(prob, bleed_full_names, file=file)
\ No newline at end of file
+    pyc.print_bleed(prob, bleed_full_names, file=file)
+
+    file.flush()
@@ -202,6 +202,7 @@ class MPCycle(om.Group):
         self._od_pnts= []
         self._des_od_connections = []
         self._use_default_des_od_conns = False
+        self._pnt_parents = {}
         super(MPCycle, self).__init__(**kwargs)
 
 
@@ -233,16 +234,27 @@ class MPCycle(om.Group):
         self._default_des_od_cons_skip = skip
         self._use_default_des_od_conns = True
 
-    def pyc_add_pnt(self, name, pnt, **kwargs):
+    def pyc_add_pnt(self, name, pnt, group=None, **kwargs):
+        """
+        Add a design or off-design point to the MPCycle. 
+
+        If `group` is given, the point is added to that group instead of directly to this one. 
+        The group must be a direct subsystem of this MPCycle that promotes '*' (e.g. a ParallelGroup 
+        used to run several off-design points concurrently), so the point keeps its top level name.
+        """
+        parent = self if group is None else group
+
         if pnt.options['design'] is True:
             if self._des_pnt is not None:
                 raise ValueError(f'Only one design point is allowed. A design point named `{self._des_pnt.name}` already exists.')
 
-            self.add_subsystem(name, pnt, **kwargs)
+            parent.add_subsystem(name, pnt, **kwargs)
             self._des_pnt = pnt
         elif pnt.options['design'] is False:
-            self.add_subsystem(name, pnt, **kwargs)
+            parent.add_subsystem(name, pnt, **kwargs)
             self._od_pnts.append(pnt)
+
+        self._pnt_parents[name] = parent
             
         return pnt
 
@@ -255,9 +267,9 @@ class MPCycle(om.Group):
         for param, (val, units) in self._cycle_params.items(): 
             self.set_input_defaults(name=param, val=val, units=units)
         
-            self.promotes(self._des_pnt.name, inputs=[param])
+            self._pnt_parents[self._des_pnt.name].promotes(self._des_pnt.name, inputs=[param])
             for pnt in self._od_pnts: 
-                self.promotes(pnt.name, inputs=[param])
+                self._pnt_parents[pnt.name].promotes(pnt.name, inputs=[param])
 
 
         for src, target in self._des_od_connections: 